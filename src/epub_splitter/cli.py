@@ -3,19 +3,10 @@
 from pathlib import Path
 from typing import Optional
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.panel import Panel
 
-from epub_splitter.detector import EpubChapterDetector
-from epub_splitter.splitter import EpubSplitter
 from epub_splitter import __version__
 
 
-console = Console()
-
-
 @click.group()
 @click.version_option(version=__version__, prog_name="epub-splitter")
 def main() -> None:
@@ -68,6 +59,13 @@ def main() -> None:
     help="Output format - EPUB or PDF (default: epub)",
 )
 @click.option("--no-metadata", is_flag=True, help="Do not preserve metadata in split files")
+@click.option("--no-cache", is_flag=True, help="Do not reuse or store cached detection results")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Worker processes for large books (default: one per CPU). Use 1 to stay in a single process.",
+)
 def split(
     epub_file: Path,
     output_dir: Optional[Path],
@@ -77,6 +75,8 @@ def split(
     pattern: str,
     output_format: str,
     no_metadata: bool,
+    no_cache: bool,
+    workers: Optional[int],
 ) -> None:
     """
     Split an EPUB file by detected chapters.
@@ -91,6 +91,15 @@ def split(
 
         epub-splitter split ebook.epub --strategy structural --sensitivity high
     """
+    # Heavy imports are deferred so --help and --version stay fast
+    from rich.console import Console
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.panel import Panel
+
+    from epub_splitter.detector import EpubChapterDetector
+    from epub_splitter.splitter import EpubSplitter
+
+    console = Console()
     try:
         # Validate EPUB file
         if not epub_file.suffix.lower() == ".epub":
@@ -117,7 +126,11 @@ def split(
         ) as progress:
             progress.add_task("Analyzing EPUB and detecting chapters...", total=None)
             detector = EpubChapterDetector(
-                strategy=strategy, sensitivity=sensitivity, toc_level=toc_level  # type: ignore[arg-type]
+                strategy=strategy,  # type: ignore[arg-type]
+                sensitivity=sensitivity,  # type: ignore[arg-type]
+                toc_level=toc_level,
+                use_cache=not no_cache,
+                max_workers=workers,
             )
             result = detector.detect(epub_file)
 
@@ -149,18 +162,24 @@ def split(
         format_name = "PDFs" if output_format == "pdf" else "EPUBs"
         console.print(f"\n[cyan]Splitting into {result.chapter_count} {format_name}...[/cyan]")
 
-        splitter = EpubSplitter(output_dir, filename_pattern=pattern, output_format=output_format)  # type: ignore
+        splitter = EpubSplitter(
+            output_dir,
+            filename_pattern=pattern,
+            output_format=output_format,  # type: ignore[arg-type]
+            max_workers=workers,
+        )
 
         with Progress(console=console) as progress:
             progress_msg = f"[cyan]Creating chapter {format_name}..."
             task = progress.add_task(progress_msg, total=len(result.chapters))
 
             created_files = splitter.split(
-                epub_file, result.chapters, preserve_metadata=not no_metadata
+                epub_file,
+                result.chapters,
+                preserve_metadata=not no_metadata,
+                progress_callback=lambda done, total: progress.update(task, completed=done),
             )
 
-            progress.update(task, completed=len(result.chapters))
-
         # Display success message
         console.print(
             f"\n[bold green]✓ Successfully split into {len(created_files)} files[/bold green]"
@@ -194,11 +213,20 @@ def split(
     default=1,
     help="TOC hierarchy level to use (default: 1)",
 )
+@click.option("--no-cache", is_flag=True, help="Do not reuse or store cached detection results")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Worker processes for large books (default: one per CPU). Use 1 to stay in a single process.",
+)
 def preview(
     epub_file: Path,
     strategy: str,
     sensitivity: str,
     toc_level: int,
+    no_cache: bool,
+    workers: Optional[int],
 ) -> None:
     """
     Preview detected chapters without splitting.
@@ -213,6 +241,15 @@ def preview(
 
         epub-splitter preview ebook.epub --toc-level 2
     """
+    # Heavy imports are deferred so --help and --version stay fast
+    from rich.console import Console
+    from rich.table import Table
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.panel import Panel
+
+    from epub_splitter.detector import EpubChapterDetector
+
+    console = Console()
     try:
         # Validate EPUB file
         if not epub_file.suffix.lower() == ".epub":
@@ -233,7 +270,11 @@ def preview(
         ) as progress:
             progress.add_task("Analyzing EPUB and detecting chapters...", total=None)
             detector = EpubChapterDetector(
-                strategy=strategy, sensitivity=sensitivity, toc_level=toc_level  # type: ignore[arg-type]
+                strategy=strategy,  # type: ignore[arg-type]
+                sensitivity=sensitivity,  # type: ignore[arg-type]
+                toc_level=toc_level,
+                use_cache=not no_cache,
+                max_workers=workers,
             )
             result = detector.detect(epub_file)
 
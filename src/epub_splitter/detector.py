@@ -1,17 +1,465 @@
 """EPUB chapter detection functionality."""
 
+import hashlib
+import json
+import os
+import posixpath
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from functools import lru_cache
+from io import BytesIO
+from itertools import repeat
 from pathlib import Path
-from typing import List, Literal, Tuple
-from lxml import html as lxml_html  # type: ignore
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Set, Tuple, Union
+from urllib.parse import unquote
+from lxml import etree  # type: ignore
 import ebooklib  # type: ignore
 from ebooklib import epub  # type: ignore
 
+from epub_splitter import __version__
 from epub_splitter.models import EpubChapter, EpubDetectionResult
-
+from pdf_splitter.workers import worker_count
 
 DetectionStrategy = Literal["native", "structural", "manifest", "hybrid"]
 SensitivityLevel = Literal["low", "medium", "high"]
 
+# XML namespaces used by the EPUB container, package and navigation documents
+_CONTAINER_NS = "urn:oasis:names:tc:opendocument:xmlns:container"
+_OPF_NS = "http://www.idpf.org/2007/opf"
+_NCX_NS = "http://www.daisy.org/z3986/2005/ncx/"
+_XHTML_NS = "http://www.w3.org/1999/xhtml"
+_OPS_NS = "http://www.idpf.org/2007/ops"
+
+# (level, title, href) triple describing a single TOC entry
+TocEntry = Tuple[int, str, str]
+
+# (name, content) of a content document, name relative to the OPF directory
+Document = Tuple[str, bytes]
+
+# Heading tags to look for based on sensitivity
+_HEADING_TAGS = {
+    "low": ("h1",),
+    "medium": ("h1", "h2"),
+    "high": ("h1", "h2", "h3"),
+}
+
+# Heading tag -> (hierarchy level, confidence) for structural detection
+_TAG_INFO = {"h1": (1, 1.0), "h2": (2, 0.7), "h3": (3, 0.5)}
+
+# ebooklib classes that can appear as entries in book.toc
+_TOC_ENTRY_TYPES = (epub.Link, epub.Section)
+
+# Errors raised by lxml for empty, malformed or mis-encoded documents
+_PARSE_ERRORS = (etree.XMLSyntaxError, etree.ParserError, UnicodeDecodeError)
+
+# Title candidates in one tree walk, compiled once
+_TITLE_XPATH = etree.XPath("//h1 | //h2")
+
+# Byte order marks of UTF-16, the only other encoding EPUB permits
+_UTF16_BOMS = (b"\xff\xfe", b"\xfe\xff")
+
+# Turns underscores in file names into word breaks
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+
+# Below this many content documents, process startup costs more than it saves
+_PARALLEL_MIN_DOCUMENTS = 32
+
+# (title, html_id, level, confidence) for a heading found in a content document
+HeadingInfo = Tuple[str, Optional[str], int, float]
+
+
+def _parse_xhtml_headings(content: bytes, tags: Tuple[str, ...]) -> List[HeadingInfo]:
+    """
+    Find headings in a single XHTML document.
+
+    Runs in worker processes, so it only takes and returns picklable values.
+
+    Args:
+        content: Raw XHTML document
+        tags: Heading tags to look for
+
+    Returns:
+        List of (title, html_id, level, confidence) tuples in reading order
+    """
+    headings: List[HeadingInfo] = []
+
+    try:
+        # Single streaming pass over the document, headings in reading order
+        for _, heading in etree.iterparse(BytesIO(content), events=("end",), tag=tags, html=True):
+            title = "".join(heading.itertext()).strip()
+            if title:
+                level, confidence = _TAG_INFO[heading.tag]
+                headings.append((title, heading.get("id"), level, confidence))
+
+            # Free the heading and everything parsed before it
+            heading.clear(keep_tail=True)
+            while heading.getprevious() is not None:
+                del heading.getparent()[0]
+    except _PARSE_ERRORS:
+        # Skip files that can't be parsed
+        pass
+
+    return headings
+
+
+def _title_from_filename(name: str) -> str:
+    """
+    Build a fallback chapter title from a document file name.
+
+    Args:
+        name: Archive path of the document, e.g. "text/chapter_01.xhtml"
+
+    Returns:
+        File stem with underscores as spaces and each word capitalized
+    """
+    base = name.rpartition("/")[2]
+    stem = base.rpartition(".")[0] or base
+    words = stem.translate(_UNDERSCORE_TO_SPACE).split()
+    return " ".join(word[:1].upper() + word[1:] for word in words)
+
+
+def _cache_dir() -> Path:
+    """Directory holding cached detection results."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "epub-splitter"
+
+
+def _load_cached_result(cache_file: Path) -> Optional[EpubDetectionResult]:
+    """
+    Load a cached detection result.
+
+    Args:
+        cache_file: Path to the cache entry
+
+    Returns:
+        Cached result, or None if missing or unreadable
+    """
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            data = json.load(f)
+        return EpubDetectionResult(
+            chapters=[EpubChapter(**chapter) for chapter in data["chapters"]],
+            strategy_used=data["strategy_used"],
+            total_files=data["total_files"],
+            has_toc=data["has_toc"],
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _store_result(cache_file: Path, result: EpubDetectionResult) -> None:
+    """
+    Write a detection result to the cache, ignoring filesystem errors.
+
+    The entry is written to a temporary file and moved into place, so a
+    concurrent reader never sees a partial entry.
+
+    Args:
+        cache_file: Path to the cache entry
+        result: Detection result to store
+    """
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=cache_file.parent, suffix=".tmp", delete=False
+        ) as f:
+            json.dump(asdict(result), f)
+        try:
+            os.replace(f.name, cache_file)
+        except OSError:
+            os.unlink(f.name)
+            raise
+    except OSError:
+        pass
+
+
+def _unique_locations(chapters: List[EpubChapter]) -> List[EpubChapter]:
+    """
+    Drop chapters pointing at an already seen location, keeping the first.
+
+    Chapters with the same file and anchor would be split into identical files.
+
+    Args:
+        chapters: Detected chapters in reading order
+
+    Returns:
+        Chapters with unique (file_path, html_id) locations
+    """
+    seen: Set[Tuple[str, Optional[str]]] = set()
+    unique: List[EpubChapter] = []
+
+    for chapter in chapters:
+        key = (chapter.file_path, chapter.html_id)
+        if key not in seen:
+            seen.add(key)
+            unique.append(chapter)
+
+    return unique
+
+
+@lru_cache(maxsize=4)
+def _read_book_cached(
+    epub_path: str, mtime_ns: int
+) -> Tuple[epub.EpubBook, Tuple[epub.EpubItem, ...]]:
+    """
+    Read an EPUB with ebooklib, reusing the result for unchanged files.
+
+    Args:
+        epub_path: Path to the EPUB file
+        mtime_ns: Modification time of the file, part of the cache key
+
+    Returns:
+        Tuple of (EpubBook, content documents)
+    """
+    # Prefer the EPUB 3 nav over the NCX whatever the ebooklib default is
+    book = epub.read_epub(epub_path, options={"ignore_ncx": True})
+    return book, tuple(book.get_items_of_type(ebooklib.ITEM_DOCUMENT))
+
+
+class _EbooklibEpub:
+    """Exposes an ebooklib EpubBook through the same interface as _FastEpub."""
+
+    def __init__(self, epub_path: Path):
+        """
+        Read the whole EPUB with ebooklib.
+
+        Args:
+            epub_path: Path to the EPUB file
+        """
+        self.book, self._documents = _read_book_cached(str(epub_path), epub_path.stat().st_mtime_ns)
+
+    def __enter__(self) -> "_EbooklibEpub":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+    @property
+    def document_count(self) -> int:
+        """Number of content documents in the book."""
+        return len(self._documents)
+
+    def documents(self) -> Iterator[Document]:
+        """Yield (name, content) for every content document in manifest order."""
+        return ((item.get_name(), item.get_content()) for item in self._documents)
+
+    def spine_items(self) -> Iterator[Document]:
+        """Yield (name, content) for content documents in reading order."""
+        # get_item_with_id() scans the whole manifest, so index documents once
+        documents = {item.get_id(): item for item in self._documents}
+
+        for item_id, _ in self.book.spine:
+            item = documents.get(item_id)
+            if item:
+                yield item.get_name(), item.get_content()
+
+
+class _FastEpub:
+    """
+    Read-only view of an EPUB archive with just what chapter detection needs.
+
+    Only the container and OPF package document are parsed up front; the TOC
+    and content documents are read from the zip on demand, so nothing is
+    decompressed unless a strategy actually asks for it.
+    """
+
+    def __init__(self, epub_path: Path):
+        """
+        Open the EPUB and parse its package document.
+
+        Args:
+            epub_path: Path to the EPUB file
+
+        Raises:
+            KeyError: If the container or package document is missing
+            zipfile.BadZipFile: If the file is not a zip archive
+            etree.XMLSyntaxError: If the container or package document is malformed
+        """
+        self._zf = zipfile.ZipFile(epub_path)
+        try:
+            container = etree.fromstring(self._zf.read("META-INF/container.xml"))
+            rootfile = container.find(f".//{{{_CONTAINER_NS}}}rootfile")
+            if rootfile is None:
+                raise KeyError("rootfile")
+            opf_path = rootfile.get("full-path", "")
+            self._opf_dir = posixpath.dirname(opf_path)
+            opf = etree.fromstring(self._zf.read(opf_path))
+        except BaseException:
+            self._zf.close()
+            raise
+
+        # Manifest id -> href, plus content documents in manifest order
+        self._hrefs: Dict[str, str] = {}
+        self._document_ids: List[str] = []
+        self._nav_href: Optional[str] = None
+        for item in opf.iterfind(f"{{{_OPF_NS}}}manifest/{{{_OPF_NS}}}item"):
+            item_id = item.get("id")
+            href = unquote(item.get("href", ""))
+            self._hrefs[item_id] = href
+            if item.get("media-type") == "application/xhtml+xml":
+                self._document_ids.append(item_id)
+                if "nav" in item.get("properties", "").split():
+                    self._nav_href = href
+
+        spine = opf.find(f"{{{_OPF_NS}}}spine")
+        self._spine_ids: List[str] = []
+        self._ncx_href: Optional[str] = None
+        if spine is not None:
+            self._spine_ids = [ref.get("idref") for ref in spine.iterfind(f"{{{_OPF_NS}}}itemref")]
+            self._ncx_href = self._hrefs.get(spine.get("toc"))
+
+    def __enter__(self) -> "_FastEpub":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying zip file."""
+        self._zf.close()
+
+    @property
+    def document_count(self) -> int:
+        """Number of content documents in the manifest."""
+        return len(self._document_ids)
+
+    def read(self, href: str) -> bytes:
+        """Read a file by its href relative to the OPF directory."""
+        return self._zf.read(posixpath.join(self._opf_dir, href))
+
+    def documents(self) -> Iterator[Document]:
+        """Yield (name, content) for every content document in manifest order."""
+        return self._read_documents(self._document_ids)
+
+    def spine_items(self) -> Iterator[Document]:
+        """Yield (name, content) for content documents in reading order."""
+        document_ids = set(self._document_ids)
+        return self._read_documents(i for i in self._spine_ids if i in document_ids)
+
+    def toc(self) -> List[TocEntry]:
+        """
+        Flatten the table of contents.
+
+        Prefers the EPUB 3 nav document, then the NCX, matching ebooklib
+        with ``ignore_ncx`` set.
+
+        Returns:
+            List of (level, title, href) entries in reading order
+        """
+        try:
+            if self._nav_href:
+                data = self.read(self._nav_href)
+                return _parse_nav_entries(data, posixpath.dirname(self._nav_href))
+            if self._ncx_href:
+                data = self.read(self._ncx_href)
+                return _parse_ncx_entries(data, posixpath.dirname(self._ncx_href))
+        except (KeyError, etree.XMLSyntaxError):
+            pass
+        return []
+
+    def _read_documents(self, item_ids: Iterable[str]) -> Iterator[Document]:
+        """Lazily read documents by manifest id, skipping files missing from the zip."""
+        for item_id in item_ids:
+            href = self._hrefs[item_id]
+            try:
+                yield href, self.read(href)
+            except KeyError:
+                continue
+
+
+def _resolve_toc_href(base_dir: str, href: str) -> str:
+    """Resolve a TOC href relative to the OPF directory."""
+    href = unquote(href)
+    if base_dir:
+        return posixpath.normpath(posixpath.join(base_dir, href))
+    return href
+
+
+def _parse_ncx_entries(data: bytes, base_dir: str) -> List[TocEntry]:
+    """
+    Flatten an NCX navMap into TOC entries.
+
+    Args:
+        data: Raw NCX document
+        base_dir: Directory of the NCX file relative to the OPF directory
+
+    Returns:
+        List of (level, title, href) entries in reading order
+    """
+    entries: List[TocEntry] = []
+    nav_point = f"{{{_NCX_NS}}}navPoint"
+    text_tag = f"{{{_NCX_NS}}}text"
+    content_tag = f"{{{_NCX_NS}}}content"
+
+    level = 0
+    title: Optional[str] = None
+
+    for event, elem in etree.iterparse(
+        BytesIO(data), events=("start", "end"), tag=(nav_point, text_tag, content_tag)
+    ):
+        if elem.tag == nav_point:
+            if event == "start":
+                level += 1
+                title = None
+            else:
+                level -= 1
+                elem.clear()
+        elif event == "end":
+            if elem.tag == text_tag:
+                # First navLabel text of the current navPoint is its title
+                if title is None and level:
+                    title = (elem.text or "").strip()
+            elif level and title is not None:
+                src = elem.get("src")
+                if src:
+                    entries.append((level, title, _resolve_toc_href(base_dir, src)))
+                title = None
+
+    return entries
+
+
+def _parse_nav_entries(data: bytes, base_dir: str) -> List[TocEntry]:
+    """
+    Flatten an EPUB 3 ``<nav epub:type="toc">`` list into TOC entries.
+
+    Args:
+        data: Raw navigation document
+        base_dir: Directory of the nav file relative to the OPF directory
+
+    Returns:
+        List of (level, title, href) entries in reading order
+    """
+    entries: List[TocEntry] = []
+    nav_tag = f"{{{_XHTML_NS}}}nav"
+    ol_tag = f"{{{_XHTML_NS}}}ol"
+    a_tag = f"{{{_XHTML_NS}}}a"
+    epub_type = f"{{{_OPS_NS}}}type"
+
+    in_toc = False
+    level = 0
+
+    for event, elem in etree.iterparse(
+        BytesIO(data), events=("start", "end"), tag=(nav_tag, ol_tag, a_tag)
+    ):
+        if elem.tag == nav_tag:
+            if event == "start" and not entries:
+                in_toc = "toc" in elem.get(epub_type, "").split()
+            elif event == "end":
+                in_toc = False
+        elif not in_toc:
+            continue
+        elif elem.tag == ol_tag:
+            level += 1 if event == "start" else -1
+        elif event == "end":
+            href = elem.get("href")
+            if href:
+                title = "".join(elem.itertext()).strip()
+                entries.append((level, title, _resolve_toc_href(base_dir, href)))
+
+    return entries
+
 
 class EpubChapterDetector:
     """Detects chapters in EPUB files using various strategies."""
@@ -21,6 +469,9 @@ class EpubChapterDetector:
         strategy: DetectionStrategy = "hybrid",
         sensitivity: SensitivityLevel = "medium",
         toc_level: int = 1,
+        legacy: bool = False,
+        use_cache: bool = False,
+        max_workers: Optional[int] = 1,
     ):
         """
         Initialize the detector.
@@ -29,10 +480,23 @@ class EpubChapterDetector:
             strategy: Detection strategy to use
             sensitivity: Sensitivity level for structural detection
             toc_level: Which TOC hierarchy level to extract (1=top-level, 2=subsections, etc.)
+            legacy: Read the whole book with ebooklib instead of reading the archive directly
+            use_cache: Reuse detection results cached on disk for unchanged files
+            max_workers: Worker processes for structural detection (see pdf_splitter.workers)
         """
         self.strategy = strategy
         self.sensitivity = sensitivity
         self.toc_level = toc_level
+        self.legacy = legacy
+        self.use_cache = use_cache
+        self.max_workers = max_workers
+        self._heading_tags = _HEADING_TAGS.get(sensitivity, _HEADING_TAGS["medium"])
+        # Reused for every document; EPUB content is UTF-8, so skip encoding detection.
+        # lxml parsers are not thread-safe, so this must not be shared across threads;
+        # structural workers run in separate processes and parse with their own state.
+        self._html_parser = etree.HTMLParser(
+            encoding="utf-8", remove_comments=True, remove_blank_text=True
+        )
 
     def detect(self, epub_path: Path) -> EpubDetectionResult:
         """
@@ -44,43 +508,113 @@ class EpubChapterDetector:
         Returns:
             EpubDetectionResult containing detected chapters
         """
-        book = epub.read_epub(str(epub_path))
-
-        # Get content files count
-        content_files = list(book.get_items_of_type(ebooklib.ITEM_DOCUMENT))
-        total_files = len(content_files)
-
-        # Try detection strategies based on selected strategy
-        if self.strategy == "native":
-            chapters, has_toc = self._detect_from_toc(book)
-            strategy_used = "native"
-        elif self.strategy == "structural":
-            chapters = self._detect_from_structure(book)
-            has_toc = False
-            strategy_used = "structural"
-        elif self.strategy == "manifest":
-            chapters = self._detect_from_manifest(book)
-            has_toc = False
-            strategy_used = "manifest"
-        else:  # hybrid
-            chapters, has_toc = self._detect_from_toc(book)
-            if not chapters:
-                chapters = self._detect_from_structure(book)
-                strategy_used = "structural (fallback)"
-            else:
+        cache_file = None
+        if self.use_cache:
+            cache_file = _cache_dir() / f"{self._cache_key(epub_path)}.json"
+            cached = _load_cached_result(cache_file)
+            if cached is not None:
+                return cached
+
+        with self._open(epub_path) as source:
+            total_files = source.document_count
+
+            # Try detection strategies based on selected strategy
+            if self.strategy == "native":
+                chapters, has_toc = self._detect_toc(source)
                 strategy_used = "native"
-
-            if not chapters:
-                chapters = self._detect_from_manifest(book)
-                strategy_used = "manifest (fallback)"
-
-        return EpubDetectionResult(
-            chapters=chapters,
+            elif self.strategy == "structural":
+                chapters = self._detect_from_structure(source.documents())
+                has_toc = False
+                strategy_used = "structural"
+            elif self.strategy == "manifest":
+                chapters = self._detect_from_manifest(source.spine_items())
+                has_toc = False
+                strategy_used = "manifest"
+            else:  # hybrid
+                chapters, has_toc = self._detect_toc(source)
+                if not chapters:
+                    chapters = self._detect_from_structure(source.documents())
+                    strategy_used = "structural (fallback)"
+                else:
+                    strategy_used = "native"
+
+                if not chapters:
+                    chapters = self._detect_from_manifest(source.spine_items())
+                    strategy_used = "manifest (fallback)"
+
+        result = EpubDetectionResult(
+            chapters=_unique_locations(chapters),
             strategy_used=strategy_used,
             total_files=total_files,
             has_toc=has_toc,
         )
 
+        if cache_file is not None:
+            _store_result(cache_file, result)
+
+        return result
+
+    def _cache_key(self, epub_path: Path) -> str:
+        """
+        Build the cache key for a file and the current detection settings.
+
+        Args:
+            epub_path: Path to the EPUB file
+
+        Returns:
+            Hex digest identifying the file version, settings and package version
+        """
+        key = "|".join(
+            str(part)
+            for part in (
+                __version__,
+                epub_path.resolve(),
+                epub_path.stat().st_mtime_ns,
+                self.strategy,
+                self.sensitivity,
+                self.toc_level,
+                self.legacy,
+            )
+        )
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def _open(self, epub_path: Path) -> Union[_FastEpub, _EbooklibEpub]:
+        """
+        Open an EPUB for detection.
+
+        Args:
+            epub_path: Path to the EPUB file
+
+        Returns:
+            Direct archive reader, or the ebooklib reader in legacy mode or
+            when the archive can't be read directly
+        """
+        if not self.legacy:
+            try:
+                return _FastEpub(epub_path)
+            except (KeyError, zipfile.BadZipFile, etree.XMLSyntaxError):
+                # Let ebooklib handle (or report) archives we can't read ourselves
+                pass
+        return _EbooklibEpub(epub_path)
+
+    def _detect_toc(
+        self, source: Union[_FastEpub, _EbooklibEpub]
+    ) -> Tuple[List[EpubChapter], bool]:
+        """
+        Detect chapters from the table of contents of an opened EPUB.
+
+        Args:
+            source: Opened EPUB
+
+        Returns:
+            Tuple of (list of chapters, whether TOC exists)
+        """
+        if isinstance(source, _EbooklibEpub):
+            return self._detect_from_toc(source.book)
+
+        entries = source.toc()
+        return self._chapters_from_toc_entries(entries), bool(entries)
+
     def _detect_from_toc(self, book: epub.EpubBook) -> Tuple[List[EpubChapter], bool]:
         """
         Detect chapters from EPUB table of contents.
@@ -91,78 +625,105 @@ class EpubChapterDetector:
         Returns:
             Tuple of (list of chapters, whether TOC exists)
         """
-        chapters: List[EpubChapter] = []
+        toc = getattr(book, "toc", None)
+        if not toc:
+            return [], False
 
-        try:
-            toc = book.toc
-            if not toc:
-                return [], False
+        # Same level selection as the direct archive reader
+        return self._chapters_from_toc_entries(self._flatten_toc(toc)), True
 
-            # Flatten TOC and filter by level
-            self._extract_toc_entries(toc, chapters, current_level=1)
+    def _effective_toc_level(self, levels: Set[int]) -> int:
+        """
+        Choose the TOC level to extract.
 
-            # Filter by requested level
-            if self.toc_level > 0:
-                chapters = [ch for ch in chapters if ch.level == self.toc_level]
+        Falls back to the deepest level above the requested one when the TOC
+        does not go that deep, so a shallow TOC still yields chapters instead
+        of triggering a structural re-parse.
 
-            return chapters, True
+        Args:
+            levels: Levels present in the TOC
 
-        except (AttributeError, Exception):
-            return [], False
+        Returns:
+            TOC level to extract
+        """
+        if self.toc_level in levels or not levels:
+            return self.toc_level
 
-    def _extract_toc_entries(
-        self,
-        toc_items: List,
-        chapters: List[EpubChapter],
-        current_level: int = 1,
-    ) -> None:
+        shallower = [level for level in levels if level < self.toc_level]
+        return max(shallower) if shallower else min(levels)
+
+    def _chapters_from_toc_entries(self, entries: List[TocEntry]) -> List[EpubChapter]:
+        """
+        Build chapters from flattened TOC entries at the requested level.
+
+        Args:
+            entries: List of (level, title, href) TOC entries
+
+        Returns:
+            List of chapters
+        """
+        chapters: List[EpubChapter] = []
+        target_level = 0
+        if self.toc_level > 0:
+            target_level = self._effective_toc_level({entry[0] for entry in entries})
+
+        for level, title, href in entries:
+            if target_level and level != target_level:
+                continue
+
+            file_path, html_id = self._parse_href(href)
+            chapters.append(
+                EpubChapter(
+                    title=title,
+                    file_path=file_path,
+                    html_id=html_id,
+                    level=level,
+                    detection_method="native",
+                    confidence=1.0,
+                )
+            )
+
+        return chapters
+
+    def _flatten_toc(self, toc_items: List) -> List[TocEntry]:
         """
-        Recursively extract TOC entries.
+        Flatten nested ebooklib TOC entries in reading order.
+
+        Uses an explicit stack rather than recursion, so arbitrarily deep
+        navigation documents cannot hit the interpreter recursion limit.
 
         Args:
             toc_items: TOC items (can be nested)
-            chapters: List to append chapters to
-            current_level: Current hierarchy level
+
+        Returns:
+            List of (level, title, href) TOC entries that link somewhere
         """
-        for item in toc_items:
+        entries: List[TocEntry] = []
+        stack = [(iter(toc_items), 1)]
+
+        while stack:
+            items, level = stack[-1]
+            item = next(items, None)
+            if item is None:
+                stack.pop()
+                continue
+
+            children = None
             if isinstance(item, tuple):
                 # Nested section: (Section, [children])
-                section, children = item
-                if hasattr(section, "title") and hasattr(section, "href"):
-                    # Parse href to get file path and anchor
-                    file_path, html_id = self._parse_href(section.href)
-
-                    chapters.append(
-                        EpubChapter(
-                            title=section.title,
-                            file_path=file_path,
-                            html_id=html_id,
-                            level=current_level,
-                            detection_method="native",
-                            confidence=1.0,
-                        )
-                    )
+                item, children = item
 
-                # Process children
-                if children:
-                    self._extract_toc_entries(children, chapters, current_level + 1)
+            # EPUB 3 nav sections may have a title but no link
+            if isinstance(item, _TOC_ENTRY_TYPES) and item.href:
+                entries.append((level, item.title, item.href))
 
-            elif hasattr(item, "title") and hasattr(item, "href"):
-                # Simple link item
-                file_path, html_id = self._parse_href(item.href)
+            # Process children before the following siblings
+            if children:
+                stack.append((iter(children), level + 1))
 
-                chapters.append(
-                    EpubChapter(
-                        title=item.title,
-                        file_path=file_path,
-                        html_id=html_id,
-                        level=current_level,
-                        detection_method="native",
-                        confidence=1.0,
-                    )
-                )
+        return entries
 
-    def _parse_href(self, href: str) -> Tuple[str, str]:
+    def _parse_href(self, href: str) -> Tuple[str, Optional[str]]:
         """
         Parse href into file path and HTML ID.
 
@@ -170,135 +731,167 @@ class EpubChapterDetector:
             href: HREF string (e.g., "chapter1.xhtml#section2")
 
         Returns:
-            Tuple of (file_path, html_id)
+            Tuple of (file_path, html_id), html_id is None without a fragment
         """
-        if "#" in href:
-            file_path, html_id = href.split("#", 1)
-            return file_path, html_id
-        return href, ""
+        file_path, _, html_id = href.partition("#")
+        return file_path, html_id or None
 
-    def _detect_from_structure(self, book: epub.EpubBook) -> List[EpubChapter]:
+    def _detect_from_structure(self, documents: Iterable[Document]) -> List[EpubChapter]:
         """
         Detect chapters by analyzing HTML structure (headings).
 
         Args:
-            book: EpubBook object
+            documents: (name, content) pairs of the book's content documents
 
         Returns:
             List of detected chapters
         """
         chapters: List[EpubChapter] = []
+        tags = self._heading_tags
+
+        results: Iterable[Tuple[str, List[HeadingInfo]]]
+        workers = worker_count(self.max_workers)
+        if workers < 2:
+            # Read and parse one document at a time so only one is ever in memory
+            results = ((name, _parse_xhtml_headings(content, tags)) for name, content in documents)
+        else:
+            # Parsing is CPU-bound, so read all document bytes up front for the workers
+            names: List[str] = []
+            contents: List[bytes] = []
+            for name, content in documents:
+                names.append(name)
+                contents.append(content)
+
+            if len(contents) < _PARALLEL_MIN_DOCUMENTS:
+                results = zip(names, [_parse_xhtml_headings(content, tags) for content in contents])
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = zip(
+                        names,
+                        list(
+                            executor.map(_parse_xhtml_headings, contents, repeat(tags), chunksize=8)
+                        ),
+                    )
 
-        # Heading tags to look for based on sensitivity
-        heading_tags = {
-            "low": ["h1"],
-            "medium": ["h1", "h2"],
-            "high": ["h1", "h2", "h3"],
-        }
-        tags = heading_tags.get(self.sensitivity, ["h1", "h2"])
-
-        for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
-            try:
-                content = item.get_content()
-                tree = lxml_html.fromstring(content)
-
-                # Find headings
-                for tag in tags:
-                    headings = tree.xpath(f"//{tag}")
-
-                    for heading in headings:
-                        title = heading.text_content().strip()
-                        if title:
-                            # Get heading level (h1=1, h2=2, h3=3)
-                            level = int(tag[1])
-
-                            # Calculate confidence based on tag level
-                            confidence = 1.0 if tag == "h1" else 0.7 if tag == "h2" else 0.5
-
-                            # Get ID attribute if exists
-                            html_id = heading.get("id")
-
-                            chapters.append(
-                                EpubChapter(
-                                    title=title,
-                                    file_path=item.get_name(),
-                                    html_id=html_id,
-                                    level=level,
-                                    detection_method="structural",
-                                    confidence=confidence,
-                                )
-                            )
-            except Exception:
-                # Skip files that can't be parsed
-                continue
+        for file_path, headings in results:
+            for title, html_id, level, confidence in headings:
+                chapters.append(
+                    EpubChapter(
+                        title=title,
+                        file_path=file_path,
+                        html_id=html_id,
+                        level=level,
+                        detection_method="structural",
+                        confidence=confidence,
+                    )
+                )
 
         return chapters
 
-    def _detect_from_manifest(self, book: epub.EpubBook) -> List[EpubChapter]:
+    def _detect_from_manifest(self, spine_items: Iterable[Document]) -> List[EpubChapter]:
         """
         Detect chapters from EPUB spine/manifest (one chapter per file).
 
         Args:
-            book: EpubBook object
+            spine_items: (name, content) pairs of content documents in reading order
 
         Returns:
             List of detected chapters
         """
         chapters: List[EpubChapter] = []
 
-        # Get items in reading order from spine
-        for item_id, _ in book.spine:
-            item = book.get_item_with_id(item_id)
-
-            if item and item.get_type() == ebooklib.ITEM_DOCUMENT:
-                # Try to extract title from first heading or use filename
-                title = self._extract_title_from_content(item)
-                if not title:
-                    title = Path(item.get_name()).stem.replace("_", " ").title()
-
-                chapters.append(
-                    EpubChapter(
-                        title=title,
-                        file_path=item.get_name(),
-                        html_id=None,
-                        level=1,
-                        detection_method="manifest",
-                        confidence=0.6,
-                    )
+        for name, content in spine_items:
+            # Try to extract title from first heading or use filename
+            title = self._extract_title_from_content(content)
+            if not title:
+                title = _title_from_filename(name)
+
+            chapters.append(
+                EpubChapter(
+                    title=title,
+                    file_path=name,
+                    html_id=None,
+                    level=1,
+                    detection_method="manifest",
+                    confidence=0.6,
                 )
+            )
 
         return chapters
 
-    def _extract_title_from_content(self, item: epub.EpubItem) -> str:
+    def _parse_html(self, content: bytes) -> Any:
+        """
+        Parse an XHTML document with the detector's reusable parser.
+
+        Args:
+            content: Raw XHTML document
+
+        Returns:
+            Root element, or None for an empty document
+        """
+        if content.startswith(_UTF16_BOMS):
+            # UTF-16 documents need lxml's own encoding detection
+            return etree.fromstring(
+                content, etree.HTMLParser(remove_comments=True, remove_blank_text=True)
+            )
+        return etree.fromstring(content, self._html_parser)
+
+    def _extract_title_from_content(self, content: bytes) -> str:
         """
         Extract title from HTML content.
 
         Args:
-            item: EPUB item
+            content: Raw XHTML document
 
         Returns:
             Extracted title or empty string
         """
+        # ebooklib's get_content() rebuilds the head without the document's
+        # <title>, so only body headings name a chapter. Stream the document
+        # and stop at the first h1; the first h2 counts only if no h1 follows.
+        encoding = None if content.startswith(_UTF16_BOMS) else "utf-8"
+        h2_title = None
+        try:
+            for _, heading in etree.iterparse(
+                BytesIO(content),
+                events=("end",),
+                tag=("h1", "h2"),
+                html=True,
+                recover=True,
+                encoding=encoding,
+            ):
+                title = "".join(heading.itertext()).strip()
+                if heading.tag == "h1":
+                    return title
+                if h2_title is None:
+                    h2_title = title
+        except _PARSE_ERRORS:
+            pass
+        if h2_title is not None:
+            return h2_title
+
+        # Nothing found while streaming, so fall back to a full parse
         try:
-            content = item.get_content()
-            tree = lxml_html.fromstring(content)
+            tree = self._parse_html(content)
+            if tree is None:
+                return ""
 
-            # Try title tag first
-            title_elem = tree.find(".//title")
-            if title_elem is not None and title_elem.text:
-                return title_elem.text.strip()  # type: ignore[no-any-return]
+            # Collect the first h1 and h2 in a single walk
+            found: Dict[str, Any] = {}
+            for elem in _TITLE_XPATH(tree):
+                found.setdefault(elem.tag, elem)
 
             # Try first h1
-            h1 = tree.find(".//h1")
+            h1 = found.get("h1")
             if h1 is not None:
-                return h1.text_content().strip()  # type: ignore[no-any-return]
+                return "".join(h1.itertext()).strip()
 
             # Try first h2
-            h2 = tree.find(".//h2")
+            h2 = found.get("h2")
             if h2 is not None:
-                return h2.text_content().strip()  # type: ignore[no-any-return]
+                return "".join(h2.itertext()).strip()
 
-        except Exception:
+        except _PARSE_ERRORS:
             pass
 
         return ""
@@ -1,10 +1,14 @@
 """Data models for EPUB chapter detection and splitting."""
 
+import sys
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
+# Drop the per-instance __dict__ where supported (dataclass slots need Python 3.10+)
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class EpubChapter:
     """Represents a chapter in an EPUB file."""
 
@@ -24,7 +28,7 @@ class EpubChapter:
         return self.file_path
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EpubDetectionResult:
     """Result of chapter detection in an EPUB file."""
 
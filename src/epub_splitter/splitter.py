@@ -1,26 +1,243 @@
 """EPUB splitting functionality."""
 
+import posixpath
 import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from itertools import repeat
 from pathlib import Path
-from typing import List, Set, Literal
-from lxml import html as lxml_html  # type: ignore
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, Optional, Tuple
+from urllib.parse import unquote
+from lxml import etree  # type: ignore
 from ebooklib import epub  # type: ignore
 import fitz  # PyMuPDF
 
 from epub_splitter.models import EpubChapter
-
+from pdf_splitter.splitter import SANITIZE_TABLE
+from pdf_splitter.workers import worker_count
 
 OutputFormat = Literal["epub", "pdf"]
 
+# Called with (chapters done, total chapters) after each output file is written
+ProgressCallback = Callable[[int, int], None]
+
+# One metadata entry as passed to EpubBook.add_metadata: (namespace, name, value, others)
+MetadataEntry = Tuple[str, str, Any, Dict[str, str]]
+
+# Resource references in a parsed section, compiled once; attribute paths return strings
+_STYLESHEET_HREF_XPATH = etree.XPath('descendant-or-self::link[@rel="stylesheet"]/@href')
+_IMG_SRC_XPATH = etree.XPath("descendant-or-self::img/@src")
+_STYLE_XPATH = etree.XPath("descendant-or-self::style")
+
+# url() references inside CSS
+_CSS_URL_RE = re.compile(r'url\(["\']?([^"\')]+)["\']?\)')
+
+# Encoding named by an XML declaration or a <meta charset> near the top of a document
+_DECLARED_ENCODING_RE = re.compile(rb'(?:encoding|charset)\s*=\s*["\']?([A-Za-z0-9_.:-]+)')
+
+# Below this many chapters, starting workers and re-reading the book costs more than it saves
+_PARALLEL_MIN_CHAPTERS = 16
+
+# Per-process splitter and source book, set up once by _init_split_worker
+_worker_state: Dict[str, Any] = {}
+
+
+class _LazyItem(epub.EpubItem):  # type: ignore[misc]
+    """Manifest item whose content is decompressed from the archive on first use."""
+
+    content: Optional[bytes]
+
+    def __init__(
+        self,
+        archive: zipfile.ZipFile,
+        zip_name: str,
+        uid: str,
+        file_name: str,
+        media_type: str,
+        properties: List[str],
+    ):
+        super().__init__(uid=uid, file_name=file_name, media_type=media_type)
+        # Written back to the chapter manifest, e.g. "cover-image"
+        self.properties = properties
+        self._archive = archive
+        self._zip_name = zip_name
+
+    def get_content(self, default: Optional[bytes] = None) -> Optional[bytes]:
+        if not self.content:
+            self.content = self._archive.read(self._zip_name)
+        return self.content or default
+
+
+class _LazyEpub:
+    """
+    Source EPUB that parses only container.xml and the OPF up front.
+
+    Stands in for the book returned by epub.read_epub, which decompresses every
+    item; here only the items a chapter actually uses are ever read.
+    """
+
+    def __init__(self, epub_path: Path):
+        self._archive = zipfile.ZipFile(epub_path)
+        try:
+            # Reuse ebooklib's container and metadata parsing so metadata matches read_epub.
+            # These EpubReader methods are private, hence the ebooklib pin in pyproject.toml
+            reader = epub.EpubReader(str(epub_path))
+            reader.zf = self._archive
+            reader._load_container()
+            reader.container = epub.parse_string(reader.read_file(reader.opf_file))
+            reader._load_metadata()
+
+            self.metadata = reader.book.metadata
+            self._items = self._load_manifest(reader.container.getroot(), reader.opf_dir)
+        except Exception:
+            self._archive.close()
+            raise
+
+    def _load_manifest(self, package: Any, opf_dir: str) -> List[epub.EpubItem]:
+        """
+        Create lazy items for every manifest entry.
+
+        Args:
+            package: Root element of the OPF document
+            opf_dir: Archive directory holding the OPF, which hrefs are relative to
+
+        Returns:
+            Items in manifest order
+        """
+        items: List[epub.EpubItem] = []
+        manifest = package.find(f"{{{epub.NAMESPACES['OPF']}}}manifest")
+        if manifest is None:
+            return items
+
+        for entry in manifest.iterfind(f"{{{epub.NAMESPACES['OPF']}}}item"):
+            href = entry.get("href")
+            if not href:
+                continue
+
+            file_name = unquote(href)
+            media_type = entry.get("media-type")
+            # Same correction ebooklib applies on read
+            if media_type == "image/jpg":
+                media_type = "image/jpeg"
+
+            items.append(
+                _LazyItem(
+                    self._archive,
+                    posixpath.normpath(posixpath.join(opf_dir, file_name)),
+                    entry.get("id"),
+                    file_name,
+                    media_type,
+                    entry.get("properties", "").split(),
+                )
+            )
+        return items
+
+    def get_items(self) -> Iterator[epub.EpubItem]:
+        return iter(self._items)
+
+    def close(self) -> None:
+        self._archive.close()
+
+
+def _init_split_worker(
+    epub_path: str, output_dir: Path, filename_pattern: str, output_format: OutputFormat
+) -> None:
+    """
+    Load the source EPUB once in a worker process.
+
+    Args:
+        epub_path: Path to the source EPUB file
+        output_dir: Directory where split files will be saved
+        filename_pattern: Pattern for output filenames
+        output_format: Output format - 'epub' or 'pdf'
+    """
+    splitter = EpubSplitter(output_dir, filename_pattern, output_format)
+    book = _LazyEpub(Path(epub_path))
+    splitter._prepare(book)
+    _worker_state["splitter"] = splitter
+    _worker_state["book"] = book
+
+
+def _split_worker(chapter: EpubChapter, index: int, preserve_metadata: bool) -> Optional[Path]:
+    """
+    Write a single chapter using the worker's preloaded book.
+
+    Args:
+        chapter: Chapter to write
+        index: Chapter index (1-based)
+        preserve_metadata: Whether to preserve metadata in the output file
+
+    Returns:
+        Path to the created file, or None if the chapter's file is missing
+    """
+    splitter: EpubSplitter = _worker_state["splitter"]
+    return splitter._write_chapter(_worker_state["book"], chapter, index, preserve_metadata)
+
+
+def _decode_html(content: bytes) -> str:
+    """
+    Decode an (X)HTML document without losing characters.
+
+    Args:
+        content: Raw document bytes
+
+    Returns:
+        The document as UTF-8 if valid, else in its declared encoding, else latin-1
+    """
+    try:
+        return content.decode("utf-8")
+    except UnicodeDecodeError:
+        pass
+
+    match = _DECLARED_ENCODING_RE.search(content, 0, 1024)
+    if match:
+        try:
+            return content.decode(match.group(1).decode("ascii"))
+        except (LookupError, UnicodeDecodeError):
+            pass
+
+    # Every byte is valid latin-1, so this always succeeds
+    return content.decode("latin-1")
+
+
+def _extract_subtree_by_id(content: bytes, html_id: str) -> Any:
+    """
+    Find the first element with the given id, stopping as soon as it closes.
+
+    Args:
+        content: Raw (X)HTML document
+        html_id: HTML element ID to extract
+
+    Returns:
+        The complete element, or None if no element has that id
+    """
+    target = None
+    for event, elem in etree.iterparse(BytesIO(content), events=("start", "end"), html=True):
+        if event == "start":
+            if target is None and elem.get("id") == html_id:
+                target = elem
+        elif elem is target:
+            return elem
+        elif target is None:
+            # Nothing before the section is needed, so free it as we go
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    return None
+
 
 class EpubSplitter:
     """Handles splitting EPUB files by chapters."""
 
+    _SPACE_UNDERSCORE_RE = re.compile(r"[\s_]+")
+
     def __init__(
         self,
         output_dir: Path,
         filename_pattern: str = "{index:02d}_{title}.epub",
         output_format: OutputFormat = "epub",
+        max_workers: Optional[int] = 1,
     ):
         """
         Initialize the splitter.
@@ -32,109 +249,258 @@ class EpubSplitter:
                 - {title}: Chapter title (sanitized)
                 - {file}: Original XHTML filename (without extension)
             output_format: Output format - 'epub' or 'pdf'
+            max_workers: Worker processes for writing chapters (see pdf_splitter.workers)
         """
         self.output_dir = Path(output_dir)
         self.filename_pattern = filename_pattern
         self.output_format = output_format
+        self.max_workers = max_workers
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Per-split state shared by every chapter
+        self._flat_metadata: List[MetadataEntry] = []
+        self._template = b""
+        self._href_index: Dict[str, epub.EpubItem] = {}
+
     def split(
         self,
         epub_path: Path,
         chapters: List[EpubChapter],
         preserve_metadata: bool = True,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> List[Path]:
         """
         Split an EPUB file into separate files by chapters.
 
+        Large books are split in worker processes when max_workers allows more than one.
+
         Args:
             epub_path: Path to the source EPUB file
             chapters: List of chapters to split by
             preserve_metadata: Whether to preserve metadata in split files
+            progress_callback: Optional callable receiving (done, total) after each chapter
 
         Returns:
             List of paths to the created files (EPUB or PDF)
         """
-        if self.output_format == "pdf":
-            return self._split_to_pdf(epub_path, chapters, preserve_metadata)
-        else:
-            return self._split_to_epub(epub_path, chapters, preserve_metadata)
+        if len(chapters) >= _PARALLEL_MIN_CHAPTERS and worker_count(self.max_workers) > 1:
+            return self._split_in_processes(
+                epub_path, chapters, preserve_metadata, progress_callback
+            )
+
+        book = _LazyEpub(epub_path)
+        try:
+            self._prepare(book)
+            created_files: List[Path] = []
+
+            for index, chapter in enumerate(chapters, start=1):
+                output_path = self._write_chapter(book, chapter, index, preserve_metadata)
+                if output_path:
+                    created_files.append(output_path)
+
+                if progress_callback:
+                    progress_callback(index, len(chapters))
+
+            return created_files
+        finally:
+            book.close()
+            self._flat_metadata = []
+            self._template = b""
+            self._href_index = {}
 
-    def _split_to_epub(
+    def _split_in_processes(
         self,
         epub_path: Path,
         chapters: List[EpubChapter],
-        preserve_metadata: bool = True,
+        preserve_metadata: bool,
+        progress_callback: Optional[ProgressCallback],
     ) -> List[Path]:
         """
-        Split an EPUB file into separate EPUB files by chapters.
+        Write chapters in a process pool, each worker reading the source EPUB once.
 
         Args:
             epub_path: Path to the source EPUB file
             chapters: List of chapters to split by
-            preserve_metadata: Whether to preserve EPUB metadata in split files
+            preserve_metadata: Whether to preserve metadata in split files
+            progress_callback: Optional callable receiving (done, total) after each chapter
 
         Returns:
-            List of paths to the created EPUB files
+            List of paths to the created files, in chapter order
         """
-        book = epub.read_epub(str(epub_path))
         created_files: List[Path] = []
+        workers = min(worker_count(self.max_workers), len(chapters))
+        # About four batches per worker: fewer round trips, still balanced at the end
+        chunksize = max(1, len(chapters) // (4 * workers))
+        init_args = (str(epub_path), self.output_dir, self.filename_pattern, self.output_format)
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_split_worker, initargs=init_args
+        ) as executor:
+            # map yields results in chapter order, so progress stays monotonic
+            results = executor.map(
+                _split_worker,
+                chapters,
+                range(1, len(chapters) + 1),
+                repeat(preserve_metadata),
+                chunksize=chunksize,
+            )
+            for index, output_path in enumerate(results, start=1):
+                if output_path:
+                    created_files.append(output_path)
+
+                if progress_callback:
+                    progress_callback(index, len(chapters))
 
-        for index, chapter in enumerate(chapters, start=1):
-            output_path = self._generate_filename(chapter, index)
+        return created_files
 
-            # Create new EPUB with chapter content
-            new_book = self._create_chapter_epub(book, chapter, preserve_metadata)
+    def _prepare(self, book: _LazyEpub) -> None:
+        """
+        Precompute the state shared by every chapter of a split.
 
-            # Write the new EPUB
-            epub.write_epub(str(output_path), new_book)
-            created_files.append(output_path)
+        Args:
+            book: Source EPUB book
+        """
+        self._flat_metadata = self._flatten_metadata(book.metadata)
 
-        return created_files
+        # Same result as book.get_item_with_href (first match wins), without a linear scan
+        self._href_index = {}
+        for item in book.get_items():
+            self._href_index.setdefault(item.get_name(), item)
+        if self.output_format == "epub":
+            # mimetype and container.xml are the same for every chapter, so zip them once
+            self._template = self._build_template_zip()
 
-    def _split_to_pdf(
+    def _write_chapter(
         self,
-        epub_path: Path,
-        chapters: List[EpubChapter],
-        preserve_metadata: bool = True,
-    ) -> List[Path]:
+        book: _LazyEpub,
+        chapter: EpubChapter,
+        index: int,
+        preserve_metadata: bool,
+    ) -> Optional[Path]:
         """
-        Split an EPUB file into separate PDF files by chapters.
+        Write one chapter in the configured output format.
 
         Args:
-            epub_path: Path to the source EPUB file
-            chapters: List of chapters to split by
-            preserve_metadata: Whether to preserve metadata in PDF files
+            book: Source EPUB book
+            chapter: Chapter to write
+            index: Chapter index (1-based)
+            preserve_metadata: Whether to preserve metadata in the output file
 
         Returns:
-            List of paths to the created PDF files
+            Path to the created file, or None if the chapter's file is missing
         """
-        book = epub.read_epub(str(epub_path))
-        created_files: List[Path] = []
+        if self.output_format == "pdf":
+            return self._write_pdf_chapter(book, chapter, index, preserve_metadata)
+        return self._write_epub_chapter(book, chapter, index, preserve_metadata)
 
-        for index, chapter in enumerate(chapters, start=1):
-            output_path = self._generate_filename(chapter, index)
+    def _write_epub_chapter(
+        self,
+        book: _LazyEpub,
+        chapter: EpubChapter,
+        index: int,
+        preserve_metadata: bool,
+    ) -> Path:
+        """
+        Write one chapter as a separate EPUB file.
 
-            # Get chapter content
-            main_item = book.get_item_with_href(chapter.file_path)
-            if not main_item:
-                continue
+        Args:
+            book: Source EPUB book
+            chapter: Chapter to write
+            index: Chapter index (1-based)
+            preserve_metadata: Whether to preserve EPUB metadata in the output file
 
-            # Extract HTML content
-            if chapter.html_id:
-                html_content = self._extract_chapter_section(main_item, chapter.html_id)
-            else:
-                html_content = main_item.get_content()
+        Returns:
+            Path to the created EPUB file
+        """
+        output_path = self._generate_filename(chapter, index)
 
-            # Convert HTML to PDF
-            pdf_doc = self._html_to_pdf(html_content, chapter.title, preserve_metadata)
+        # Create new EPUB with chapter content
+        new_book = self._create_chapter_epub(book, chapter, preserve_metadata)
 
-            # Save PDF
-            pdf_doc.save(str(output_path))
-            pdf_doc.close()
-            created_files.append(output_path)
+        # Write the new EPUB
+        self._write_chapter_epub(output_path, self._template, new_book)
+        return output_path
 
-        return created_files
+    @staticmethod
+    def _build_template_zip() -> bytes:
+        """
+        Build the archive entries shared by every chapter EPUB.
+
+        Returns:
+            ZIP bytes holding the mimetype and META-INF/container.xml entries
+        """
+        # Chapter books use ebooklib's default content folder
+        folder_name = epub.EpubBook().FOLDER_NAME
+
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            # mimetype must come first and be stored uncompressed
+            archive.writestr("mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED)
+            archive.writestr(epub.CONTAINER_PATH, epub.CONTAINER_XML % {"folder_name": folder_name})
+        return buffer.getvalue()
+
+    @staticmethod
+    def _write_chapter_epub(output_path: Path, template: bytes, book: epub.EpubBook) -> None:
+        """
+        Write a chapter book by appending its package files to the shared template.
+
+        Args:
+            output_path: Destination EPUB file
+            template: Archive bytes from _build_template_zip
+            book: Chapter book to write
+        """
+        # Reuse ebooklib's OPF, NCX and nav generation, but not its archive setup.
+        # _write_opf and _write_items are private, hence the ebooklib pin in pyproject.toml
+        writer = epub.EpubWriter(str(output_path), book)
+        writer.process()
+
+        buffer = BytesIO(template)
+        with zipfile.ZipFile(buffer, "a", zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+            writer.out = archive
+            writer._write_opf()
+            writer._write_items()
+
+        output_path.write_bytes(buffer.getvalue())
+
+    def _write_pdf_chapter(
+        self,
+        book: _LazyEpub,
+        chapter: EpubChapter,
+        index: int,
+        preserve_metadata: bool,
+    ) -> Optional[Path]:
+        """
+        Write one chapter as a separate PDF file.
+
+        Args:
+            book: Source EPUB book
+            chapter: Chapter to write
+            index: Chapter index (1-based)
+            preserve_metadata: Whether to preserve metadata in the PDF file
+
+        Returns:
+            Path to the created PDF file, or None if the chapter's file is missing
+        """
+        output_path = self._generate_filename(chapter, index)
+
+        # Get chapter content
+        main_item = self._href_index.get(chapter.file_path)
+        if not main_item:
+            return None
+
+        # Extract HTML content
+        if chapter.html_id:
+            html_content, _ = self._extract_chapter_section(main_item, chapter.html_id)
+        else:
+            html_content = main_item.get_content()
+
+        # Convert HTML to PDF
+        pdf_doc = self._html_to_pdf(html_content, chapter.title, preserve_metadata)
+
+        # Save PDF, compressing streams and dropping duplicate objects
+        pdf_doc.save(str(output_path), garbage=4, deflate=True)
+        pdf_doc.close()
+        return output_path
 
     def _html_to_pdf(
         self, html_content: bytes, title: str, preserve_metadata: bool
@@ -150,77 +516,24 @@ class EpubSplitter:
         Returns:
             PyMuPDF Document object
         """
-        # Create a new PDF document
-        pdf_doc = fitz.open()
-
-        # Extract text from HTML
-        try:
-            text = lxml_html.fromstring(html_content).text_content()
-        except Exception:
-            # Fallback to raw HTML decode
-            try:
-                html_str = html_content.decode("utf-8")
-            except UnicodeDecodeError:
-                html_str = html_content.decode("latin-1", errors="ignore")
-            import re
-
-            text = re.sub(r"<[^>]+>", "", html_str)
-
-        # Create pages and add text
-        page_width = 595  # A4 width in points
-        page_height = 842  # A4 height in points
+        page_rect = fitz.paper_rect("a4")
         margin = 50
-        line_height = 15
-        max_chars_per_line = 80
-
-        # Split text into paragraphs
-        paragraphs = [p.strip() for p in text.split("\n") if p.strip()]
-
-        # Create first page
-        page = pdf_doc.new_page(width=page_width, height=page_height)
-        y_position = margin
-
-        for para in paragraphs:
-            # Split paragraph into lines that fit
-            words = para.split()
-            current_line = ""
-
-            for word in words:
-                test_line = current_line + " " + word if current_line else word
-                if len(test_line) > max_chars_per_line:
-                    # Insert current line and start new one
-                    if y_position > page_height - margin:
-                        # Need new page
-                        page = pdf_doc.new_page(width=page_width, height=page_height)
-                        y_position = margin
-
-                    page.insert_text(
-                        (margin, y_position),
-                        current_line,
-                        fontsize=11,
-                        fontname="helv",
-                    )
-                    y_position += line_height
-                    current_line = word
-                else:
-                    current_line = test_line
-
-            # Insert remaining text in line
-            if current_line:
-                if y_position > page_height - margin:
-                    page = pdf_doc.new_page(width=page_width, height=page_height)
-                    y_position = margin
-
-                page.insert_text(
-                    (margin, y_position),
-                    current_line,
-                    fontsize=11,
-                    fontname="helv",
-                )
-                y_position += line_height
+        content_rect = page_rect + (margin, margin, -margin, -margin)
+
+        # MuPDF lays out the HTML itself, keeping headings, paragraphs and emphasis
+        story = fitz.Story(html=_decode_html(html_content))
 
-            # Add paragraph spacing
-            y_position += int(line_height / 2)
+        buffer = BytesIO()
+        writer = fitz.DocumentWriter(buffer)
+        more = True
+        while more:
+            device = writer.begin_page(page_rect)
+            more, _ = story.place(content_rect)
+            story.draw(device)
+            writer.end_page()
+        writer.close()
+
+        pdf_doc = fitz.open("pdf", buffer.getvalue())
 
         # Set metadata
         if preserve_metadata:
@@ -230,7 +543,7 @@ class EpubSplitter:
 
     def _create_chapter_epub(
         self,
-        source_book: epub.EpubBook,
+        source_book: _LazyEpub,
         chapter: EpubChapter,
         preserve_metadata: bool,
     ) -> epub.EpubBook:
@@ -250,28 +563,20 @@ class EpubSplitter:
         # Set metadata
         if preserve_metadata:
             # Copy basic metadata
-            metadata = source_book.metadata
-            if metadata:
-                for namespace, data in metadata.items():
-                    for key, values in data.items():
-                        for value in values:
-                            if isinstance(value, tuple):
-                                new_book.add_metadata(
-                                    namespace, key, value[0], value[1] if len(value) > 1 else {}
-                                )
-                            else:
-                                new_book.add_metadata(namespace, key, value)
+            for namespace, key, value, others in self._flat_metadata:
+                new_book.add_metadata(namespace, key, value, others)
 
         # Override title with chapter title
         new_book.set_title(chapter.title)
 
         # Get the main content item
-        main_item = source_book.get_item_with_href(chapter.file_path)
+        main_item = self._href_index.get(chapter.file_path)
 
         if main_item:
             # If chapter has HTML ID, extract only that section
+            section_tree = None
             if chapter.html_id:
-                content = self._extract_chapter_section(main_item, chapter.html_id)
+                content, section_tree = self._extract_chapter_section(main_item, chapter.html_id)
                 new_item = epub.EpubHtml(
                     title=chapter.title,
                     file_name=chapter.file_path,
@@ -288,7 +593,7 @@ class EpubSplitter:
             new_book.add_item(new_item)
 
             # Copy referenced resources (images, CSS, fonts)
-            resources = self._find_referenced_resources(source_book, new_item)
+            resources = self._find_referenced_resources(source_book, new_item, section_tree)
             for resource in resources:
                 new_book.add_item(resource)
 
@@ -302,7 +607,30 @@ class EpubSplitter:
 
         return new_book
 
-    def _extract_chapter_section(self, item: epub.EpubItem, html_id: str) -> bytes:
+    @staticmethod
+    def _flatten_metadata(metadata: Dict[str, Dict[str, List[Any]]]) -> List[MetadataEntry]:
+        """
+        Flatten ebooklib's nested metadata mapping into add_metadata arguments.
+
+        Args:
+            metadata: Source book metadata keyed by namespace, then name
+
+        Returns:
+            List of (namespace, name, value, others) entries
+        """
+        entries: List[MetadataEntry] = []
+        for namespace, data in (metadata or {}).items():
+            for key, values in data.items():
+                for value in values:
+                    if isinstance(value, tuple):
+                        entries.append(
+                            (namespace, key, value[0], value[1] if len(value) > 1 else {})
+                        )
+                    else:
+                        entries.append((namespace, key, value, {}))
+        return entries
+
+    def _extract_chapter_section(self, item: epub.EpubItem, html_id: str) -> Tuple[bytes, Any]:
         """
         Extract a specific section from an HTML file by ID.
 
@@ -311,94 +639,134 @@ class EpubSplitter:
             html_id: HTML element ID to extract
 
         Returns:
-            Modified HTML content as bytes
+            Tuple of (modified HTML content as bytes, parsed section element or None
+            if the original content was returned)
         """
         try:
             content = item.get_content()
-            tree = lxml_html.fromstring(content)
 
             # Find element with the specified ID
-            element = tree.get_element_by_id(html_id)
+            section = _extract_subtree_by_id(content, html_id)
 
-            if element is not None:
+            if section is not None:
                 # Create a new HTML document with just this section
-                new_tree = lxml_html.fromstring("<html><head></head><body></body></html>")
-                body = new_tree.find(".//body")
-                body.append(element)
-
-                return lxml_html.tostring(new_tree, encoding="utf-8")  # type: ignore[no-any-return]
+                markup = etree.tostring(section, method="html", encoding="utf-8", with_tail=False)
+                return b"<html><head></head><body>" + markup + b"</body></html>", section
 
             # If ID not found, return original content
-            return content  # type: ignore[no-any-return]
+            return content, None
 
         except Exception:
             # If extraction fails, return original content
-            return item.get_content()  # type: ignore[no-any-return]
+            return item.get_content(), None
 
     def _find_referenced_resources(
         self,
-        source_book: epub.EpubBook,
+        source_book: _LazyEpub,
         html_item: epub.EpubHtml,
-    ) -> Set[epub.EpubItem]:
+        pre_parsed_tree: Any = None,
+    ) -> List[epub.EpubItem]:
         """
         Find all resources (images, CSS, fonts) referenced in HTML content.
 
         Args:
             source_book: Source EPUB book
             html_item: HTML item to scan for references
+            pre_parsed_tree: Already parsed element holding html_item's content, if any
 
         Returns:
-            Set of referenced EPUB items
+            Referenced EPUB items, each once, in order of first reference
         """
-        resources: Set[epub.EpubItem] = set()
+        # Keyed by item name, so different hrefs to the same file collapse to one entry
+        resources: Dict[str, epub.EpubItem] = {}
 
-        try:
-            content = html_item.get_content()
-            tree = lxml_html.fromstring(content)
+        # References are relative to the chapter's own directory
+        base_dir = posixpath.dirname(html_item.get_name())
 
-            # Find CSS files (link rel="stylesheet")
-            for link in tree.xpath('//link[@rel="stylesheet"]'):
-                href = link.get("href")
+        try:
+            refs: Iterable[str]
+            if pre_parsed_tree is not None:
+                refs = self._references_in_tree(pre_parsed_tree)
+            else:
+                content = html_item.get_content()
+                # Prose-only chapters reference nothing; skip the parse entirely.
+                # XHTML tag names are lowercase, so a plain byte search is enough.
+                if b"<img" not in content and b"<link" not in content and b"<style" not in content:
+                    return []
+                refs = self._references_in_content(content)
+
+            for href in refs:
                 if href:
-                    resource = self._resolve_resource(source_book, html_item, href)
-                    if resource:
-                        resources.add(resource)
-
-            # Find images
-            for img in tree.xpath("//img"):
-                src = img.get("src")
-                if src:
-                    resource = self._resolve_resource(source_book, html_item, src)
-                    if resource:
-                        resources.add(resource)
-
-            # Find fonts in CSS (basic detection)
-            for style in tree.xpath("//style"):
-                style_content = style.text_content()
-                # Look for url() references in CSS
-                urls = re.findall(r'url\(["\']?([^"\')]+)["\']?\)', style_content)
-                for url in urls:
-                    resource = self._resolve_resource(source_book, html_item, url)
+                    resource = self._resolve_resource(base_dir, href)
                     if resource:
-                        resources.add(resource)
+                        resources[resource.get_name()] = resource
 
         except Exception:
             pass
 
-        return resources
+        return list(resources.values())
 
-    def _resolve_resource(
-        self,
-        source_book: epub.EpubBook,
-        base_item: epub.EpubItem,
-        href: str,
-    ) -> epub.EpubItem:
+    @staticmethod
+    def _references_in_tree(tree: Any) -> List[str]:
+        """
+        Collect resource references from an already parsed element and its descendants.
+
+        Args:
+            tree: Parsed lxml element
+
+        Returns:
+            Stylesheet hrefs, image sources and CSS url() targets
+        """
+        # Find CSS files (link rel="stylesheet")
+        refs = [str(href) for href in _STYLESHEET_HREF_XPATH(tree)]
+
+        # Find images
+        refs.extend(str(src) for src in _IMG_SRC_XPATH(tree))
+
+        # Find fonts in CSS (basic detection)
+        for style in _STYLE_XPATH(tree):
+            # Look for url() references in CSS
+            refs.extend(_CSS_URL_RE.findall("".join(style.itertext())))
+
+        return refs
+
+    @staticmethod
+    def _references_in_content(content: bytes) -> Iterator[str]:
+        """
+        Stream resource references from raw HTML without building the full tree.
+
+        Args:
+            content: Raw HTML content
+
+        Yields:
+            Stylesheet hrefs, image sources and CSS url() targets
+        """
+        # Stream only the tags that can reference resources
+        for _, elem in etree.iterparse(
+            BytesIO(content), events=("end",), tag=("link", "img", "style"), html=True
+        ):
+            if elem.tag == "link":
+                # Find CSS files (link rel="stylesheet")
+                if elem.get("rel") == "stylesheet":
+                    yield elem.get("href")
+            elif elem.tag == "img":
+                # Find images
+                yield elem.get("src")
+            else:
+                # Find fonts in CSS (basic detection): url() references in style blocks
+                yield from _CSS_URL_RE.findall("".join(elem.itertext()))
+
+            # Free handled elements as we go
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+    def _resolve_resource(self, base_dir: str, href: str) -> Optional[epub.EpubItem]:
         """
         Resolve a relative resource reference.
 
         Args:
-            source_book: Source EPUB book
-            base_item: Base item for relative path resolution
+            base_dir: Directory of the referencing item within the book
             href: Resource href (may be relative)
 
         Returns:
@@ -408,16 +776,12 @@ class EpubSplitter:
         href = href.split("#")[0]
 
         # Try direct lookup first
-        resource = source_book.get_item_with_href(href)
+        resource = self._href_index.get(href)
         if resource:
             return resource
 
-        # Try resolving relative to base item path
-        base_path = Path(base_item.get_name()).parent
-        resolved_path = (base_path / href).as_posix()
-
-        resource = source_book.get_item_with_href(resolved_path)
-        return resource
+        # Try resolving relative to the referencing item, collapsing "." and ".." segments
+        return self._href_index.get(posixpath.normpath(posixpath.join(base_dir, href)))
 
     def _generate_filename(self, chapter: EpubChapter, index: int) -> Path:
         """
@@ -466,12 +830,10 @@ class EpubSplitter:
             Sanitized filename-safe string
         """
         # Remove or replace invalid characters
-        invalid_chars = r'<>:"/\|?*'
-        for char in invalid_chars:
-            title = title.replace(char, "_")
+        title = title.translate(SANITIZE_TABLE)
 
         # Replace multiple spaces/underscores with single underscore
-        title = re.sub(r"[\s_]+", "_", title)
+        title = EpubSplitter._SPACE_UNDERSCORE_RE.sub("_", title)
 
         # Remove leading/trailing underscores
         title = title.strip("_")
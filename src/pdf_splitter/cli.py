@@ -3,19 +3,11 @@
 from pathlib import Path
 from typing import Optional
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.panel import Panel
+from click.core import ParameterSource
 
-from pdf_splitter.detector import ChapterDetector
-from pdf_splitter.splitter import PDFSplitter
 from pdf_splitter import __version__
 
 
-console = Console()
-
-
 @click.group()
 @click.version_option(version=__version__, prog_name="pdf-splitter")
 def main() -> None:
@@ -55,12 +47,36 @@ def main() -> None:
     default=1,
     help="Bookmark hierarchy level to use for splitting (default: 1). Use 1 for parts, 2 for chapters, 3 for sections, etc.",
 )
+@click.option(
+    "--heading-zone",
+    type=click.FloatRange(0.0, 1.0, min_open=True),
+    default=1.0,
+    help="Fraction of each page, from the top, searched for headings by heuristic detection (default: 1.0). E.g. 0.25 scans only the top quarter, which is faster.",
+)
+@click.option(
+    "--backend",
+    type=click.Choice(["pymupdf", "pdfium"], case_sensitive=False),
+    default="pymupdf",
+    help="Text extraction library for heuristic detection (default: pymupdf). 'pdfium' requires the optional pypdfium2 package.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Worker processes for large documents (default: one per CPU). Use 1 to stay in a single process.",
+)
 @click.option(
     "--pattern",
     type=str,
     default="{index:02d}_{title}.pdf",
     help="Filename pattern for output files (default: {index:02d}_{title}.pdf)",
 )
+@click.option(
+    "--mode",
+    type=click.Choice(["files", "bookmarked"], case_sensitive=False),
+    default="files",
+    help="Output one PDF per chapter (files) or a single <pdf_name>_bookmarked.pdf with a bookmark per chapter (bookmarked, which does not take --pattern) (default: files)",
+)
 @click.option("--no-metadata", is_flag=True, help="Do not preserve PDF metadata in split files")
 def split(
     pdf_file: Path,
@@ -68,7 +84,11 @@ def split(
     strategy: str,
     sensitivity: str,
     bookmark_level: int,
+    heading_zone: float,
+    backend: str,
+    workers: Optional[int],
     pattern: str,
+    mode: str,
     no_metadata: bool,
 ) -> None:
     """
@@ -84,6 +104,22 @@ def split(
 
         pdf-splitter split textbook.pdf --strategy heuristic --sensitivity high
     """
+    # The bookmarked file has a fixed name, so a pattern would be silently ignored
+    pattern_source = click.get_current_context().get_parameter_source("pattern")
+    if mode == "bookmarked" and pattern_source is not ParameterSource.DEFAULT:
+        raise click.UsageError("--pattern cannot be used with --mode bookmarked")
+
+    # Heavy imports are deferred so --help and --version stay fast
+    import fitz  # PyMuPDF
+    from rich.console import Console
+    from rich.table import Table
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+
+    from pdf_splitter.detector import ChapterDetector
+    from pdf_splitter.splitter import PDFSplitter
+
+    console = Console()
+    doc = None
     try:
         # Validate PDF file
         if not pdf_file.suffix.lower() == ".pdf":
@@ -101,18 +137,37 @@ def split(
         console.print(f"[dim]Sensitivity:[/dim] {sensitivity}")
         if strategy in ["bookmarks", "hybrid"]:
             console.print(f"[dim]Bookmark Level:[/dim] {bookmark_level}")
+        if heading_zone < 1.0:
+            console.print(f"[dim]Heading Zone:[/dim] top {heading_zone:.0%} of each page")
         console.print()
 
         # Detect chapters
         with Progress(
-            SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
         ) as progress:
+            # The total stays open until heuristic detection reports its page count
             task = progress.add_task("Analyzing PDF and detecting chapters...", total=None)
 
-            detector = ChapterDetector(sensitivity=sensitivity)
-            result = detector.detect(pdf_file, strategy=strategy, bookmark_level=bookmark_level)
-
-            progress.update(task, completed=True)
+            # Open the PDF once; detection and splitting share the parsed document
+            doc = fitz.open(pdf_file)
+            detector = ChapterDetector(
+                sensitivity=sensitivity,
+                heading_zone=heading_zone,
+                backend=backend,  # type: ignore[arg-type]
+                max_workers=workers,
+            )
+            result = detector.detect(
+                doc,
+                strategy=strategy,
+                bookmark_level=bookmark_level,
+                progress_callback=lambda done, total: progress.update(
+                    task, completed=done, total=total
+                ),
+            )
 
         # Display detection results
         console.print(f"\n[green]✓[/green] Found {result.chapter_count} chapter(s)\n")
@@ -160,10 +215,17 @@ def split(
         ) as progress:
             task = progress.add_task("Splitting PDF into chapters...", total=None)
 
-            splitter = PDFSplitter(output_dir, filename_pattern=pattern)
-            created_files = splitter.split(
-                pdf_file, result.chapters, preserve_metadata=not no_metadata
-            )
+            splitter = PDFSplitter(output_dir, filename_pattern=pattern, max_workers=workers)
+            if mode == "bookmarked":
+                created_files = [
+                    splitter.write_bookmarked(
+                        doc, result.chapters, preserve_metadata=not no_metadata
+                    )
+                ]
+            else:
+                created_files = splitter.split(
+                    doc, result.chapters, preserve_metadata=not no_metadata
+                )
 
             progress.update(task, completed=True)
 
@@ -183,6 +245,9 @@ def split(
     except Exception as e:
         console.print(f"\n[red]Error: {str(e)}[/red]\n")
         raise click.Abort()
+    finally:
+        if doc is not None:
+            doc.close()
 
 
 @main.command()
@@ -205,7 +270,33 @@ def split(
     default=1,
     help="Bookmark hierarchy level to use for detection (default: 1). Use 1 for parts, 2 for chapters, 3 for sections, etc.",
 )
-def preview(pdf_file: Path, strategy: str, sensitivity: str, bookmark_level: int) -> None:
+@click.option(
+    "--heading-zone",
+    type=click.FloatRange(0.0, 1.0, min_open=True),
+    default=1.0,
+    help="Fraction of each page, from the top, searched for headings by heuristic detection (default: 1.0). E.g. 0.25 scans only the top quarter, which is faster.",
+)
+@click.option(
+    "--backend",
+    type=click.Choice(["pymupdf", "pdfium"], case_sensitive=False),
+    default="pymupdf",
+    help="Text extraction library for heuristic detection (default: pymupdf). 'pdfium' requires the optional pypdfium2 package.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Worker processes for large documents (default: one per CPU). Use 1 to stay in a single process.",
+)
+def preview(
+    pdf_file: Path,
+    strategy: str,
+    sensitivity: str,
+    bookmark_level: int,
+    heading_zone: float,
+    backend: str,
+    workers: Optional[int],
+) -> None:
     """
     Preview detected chapters without splitting the PDF.
 
@@ -217,6 +308,15 @@ def preview(pdf_file: Path, strategy: str, sensitivity: str, bookmark_level: int
 
         pdf-splitter preview textbook.pdf --strategy bookmarks
     """
+    # Heavy imports are deferred so --help and --version stay fast
+    from rich.console import Console
+    from rich.table import Table
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+    from rich.panel import Panel
+
+    from pdf_splitter.detector import ChapterDetector
+
+    console = Console()
     try:
         # Validate PDF file
         if not pdf_file.suffix.lower() == ".pdf":
@@ -229,18 +329,35 @@ def preview(pdf_file: Path, strategy: str, sensitivity: str, bookmark_level: int
         console.print(f"[dim]Sensitivity:[/dim] {sensitivity}")
         if strategy in ["bookmarks", "hybrid"]:
             console.print(f"[dim]Bookmark Level:[/dim] {bookmark_level}")
+        if heading_zone < 1.0:
+            console.print(f"[dim]Heading Zone:[/dim] top {heading_zone:.0%} of each page")
         console.print()
 
         # Detect chapters
         with Progress(
-            SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
         ) as progress:
+            # The total stays open until heuristic detection reports its page count
             task = progress.add_task("Analyzing PDF and detecting chapters...", total=None)
 
-            detector = ChapterDetector(sensitivity=sensitivity)
-            result = detector.detect(pdf_file, strategy=strategy, bookmark_level=bookmark_level)
-
-            progress.update(task, completed=True)
+            detector = ChapterDetector(
+                sensitivity=sensitivity,
+                heading_zone=heading_zone,
+                backend=backend,  # type: ignore[arg-type]
+                max_workers=workers,
+            )
+            result = detector.detect(
+                pdf_file,
+                strategy=strategy,
+                bookmark_level=bookmark_level,
+                progress_callback=lambda done, total: progress.update(
+                    task, completed=done, total=total
+                ),
+            )
 
         # Display results summary
         summary_panel = Panel(result.get_summary(), title="Detection Summary", border_style="cyan")
@@ -1,72 +1,432 @@
 """Chapter detection logic for PDF files."""
 
+import ctypes
 import re
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 import fitz  # PyMuPDF
 
 from pdf_splitter.models import Chapter, DetectionResult
+from pdf_splitter.workers import worker_count
+
+try:
+    # Optional linear-time DFA backend (pip install lazy-splitter[re2])
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+try:
+    # Optional text extraction backend (pip install lazy-splitter[pdfium])
+    import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_c
+except ImportError:
+    pdfium = None
+
+TextBackend = Literal["pymupdf", "pdfium"]
+
+# Called with (pages scanned, total pages) as heuristic detection progresses
+ProgressCallback = Callable[[int, int], None]
+
+# (page number, line text, font size, chapter number) of a numbered heading line
+NumberedLine = Tuple[int, str, float, int]
+
+# Default ChapterDetector.CHAPTER_PATTERNS, matched case-insensitively
+_DEFAULT_CHAPTER_PATTERNS = (
+    r"^Chapter\s+(\d+|[IVXLCDM]+)[\s:.-]*(.*?)$",
+    r"^CHAPTER\s+(\d+|[IVXLCDM]+)[\s:.-]*(.*?)$",
+    r"^(\d+)\.\s+(.+)$",  # Numbered headings like "1. Introduction"
+    r"^Part\s+(\d+|[IVXLCDM]+)[\s:.-]*(.*?)$",
+    r"^PART\s+(\d+|[IVXLCDM]+)[\s:.-]*(.*?)$",
+)
+
+# Union of the default patterns matched in a single pass; case-insensitivity is
+# inlined so the pattern compiles unchanged under both re and re2
+_HEADING_RE = _regex.compile(
+    r"(?i)^(?:(?:chapter|part)\s+(\d+|[IVXLCDM]+)[\s:.\-]*(.*)|(\d+)\.\s+(.+))$"
+)
+
+# Lowercased openings of the word alternatives in _HEADING_RE; the numbered
+# alternative starts with a digit. Only valid for the default patterns.
+_HEADING_WORD_PREFIXES = ("chap", "part")
+
+# Text extraction flags for the heuristic pass: image blocks (and their
+# decoded pixel data) are never inspected, so don't ask MuPDF for them
+_HEURISTIC_TEXT_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+
+# Below this many pages the pool's startup cost outweighs the parallel scan
+_PARALLEL_MIN_PAGES = 64
+
+# Per-process detector and open document, set up once by _init_scan_worker
+_worker_state: Dict[str, Any] = {}
+
+
+@lru_cache(maxsize=None)
+def _compile_chapter_patterns(patterns: Tuple[str, ...]) -> Any:
+    """
+    Compile chapter heading patterns into one case-insensitive regex.
+
+    Args:
+        patterns: Regular expressions, each matched from the start of the text
+
+    Returns:
+        Compiled union of the patterns; _HEADING_RE for the defaults
+    """
+    if patterns == _DEFAULT_CHAPTER_PATTERNS:
+        return _HEADING_RE
+
+    union = "(?i)" + "|".join(f"(?:{pattern})" for pattern in patterns)
+    try:
+        return _regex.compile(union)
+    except _regex.error:
+        # Custom patterns may use syntax re2 does not support
+        return re.compile(union)
+
+
+@lru_cache(maxsize=4096)
+def _heading_confidence(text: str, font_size: float, heading_re: Any) -> float:
+    """
+    Score a potential chapter heading, memoized for repeated running headers.
+
+    Args:
+        text: The heading text
+        font_size: Font size of the text
+        heading_re: Compiled chapter heading patterns
+
+    Returns:
+        Confidence score between 0.0 and 1.0
+    """
+    confidence = 0.5  # Base confidence
+
+    # Boost confidence for explicit chapter patterns
+    if heading_re.match(text):
+        confidence += 0.4
+
+    # Boost for larger font sizes
+    if font_size >= 16:
+        confidence += 0.1
+    elif font_size >= 14:
+        confidence += 0.05
+
+    # Reduce confidence for very long headings
+    word_count = len(text.split())
+    if word_count > 10:
+        confidence -= 0.2
+    elif word_count > 6:
+        confidence -= 0.1
+
+    return min(1.0, max(0.0, confidence))
+
+
+def _heading_number(text: str, heading_re: Any) -> Optional[int]:
+    """
+    Read the arabic chapter number from a heading matching the chapter patterns.
+
+    Args:
+        text: The heading text
+        heading_re: Compiled chapter heading patterns
+
+    Returns:
+        The chapter number, or None for unnumbered or roman-numeral headings
+    """
+    match = heading_re.match(text)
+    if not match:
+        return None
+    # The first group each pattern captures is its chapter number
+    number = next((group for group in match.groups() if group is not None), "")
+    return int(number) if number.isdigit() else None
+
+
+def _increasing_run(numbers: Sequence[int]) -> List[int]:
+    """
+    Find the longest strictly increasing subsequence by patience sorting in O(n log n).
+
+    Args:
+        numbers: Values in the order they were found
+
+    Returns:
+        Indices into numbers of the subsequence members, in order
+    """
+    tails: List[int] = []  # Smallest last value of an increasing run of each length
+    tail_indices: List[int] = []
+    previous: List[int] = [-1] * len(numbers)
+
+    for index, number in enumerate(numbers):
+        length = bisect_left(tails, number)
+        if length > 0:
+            previous[index] = tail_indices[length - 1]
+        if length == len(tails):
+            tails.append(number)
+            tail_indices.append(index)
+        else:
+            tails[length] = number
+            tail_indices[length] = index
+
+    # Walk back from the end of the longest run to recover its members
+    run: List[int] = []
+    index = tail_indices[-1] if tail_indices else -1
+    while index != -1:
+        run.append(index)
+        index = previous[index]
+    run.reverse()
+
+    return run
+
+
+def _find_missing_chapter_numbers(numbers: Sequence[int]) -> List[int]:
+    """
+    Find gaps in the run of chapter numbers matched so far.
+
+    Stray matches (page references, list items) are ignored by keeping only the
+    longest strictly increasing subsequence.
+
+    Args:
+        numbers: Chapter numbers in the order their headings were found
+
+    Returns:
+        Numbers missing between the first and last chapter of that subsequence
+    """
+    run = [numbers[index] for index in _increasing_run(numbers)]
+    if not run:
+        return []
+
+    found = set(run)
+    return [number for number in range(min(run), max(run) + 1) if number not in found]
+
+
+def _pdfium_page_blocks(page: Any, heading_zone: float) -> list:
+    """
+    Lay out a pypdfium2 page's text in the shape of PyMuPDF's "dict" blocks.
+
+    PDFium reports text as a flat character stream; each line becomes a line of
+    spans, with a new span wherever the font size changes.
+
+    Args:
+        page: pypdfium2 page object
+        heading_zone: Fraction of the page, from the top, whose lines are kept
+
+    Returns:
+        A single text block holding the page's lines
+    """
+    textpage = page.get_textpage()
+    try:
+        raw = textpage.raw
+        # Character indices line up with the text range, so sizes can be
+        # looked up per index while the text itself comes back in one call
+        text = textpage.get_text_range()
+
+        min_y = None
+        if heading_zone < 1.0:
+            _, bottom, _, top = page.get_bbox()
+            min_y = top - (top - bottom) * heading_zone
+            x, y = ctypes.c_double(), ctypes.c_double()
+
+        lines: List[dict] = []
+        spans: List[dict] = []
+        run: List[str] = []
+        run_size = 0.0
+        line_start = True
+        skip_line = False
+        for index, char in enumerate(text):
+            if char in "\r\n":
+                if run:
+                    spans.append({"text": "".join(run), "size": run_size})
+                    run = []
+                if spans:
+                    lines.append({"spans": spans})
+                    spans = []
+                line_start = True
+                continue
+
+            # Lines are kept or dropped whole, by where their first character sits
+            if line_start:
+                line_start = False
+                if min_y is not None:
+                    pdfium_c.FPDFText_GetCharOrigin(raw, index, ctypes.byref(x), ctypes.byref(y))
+                    skip_line = y.value < min_y
+            if skip_line:
+                continue
+
+            size = pdfium_c.FPDFText_GetFontSize(raw, index)
+            if size != run_size and run:
+                spans.append({"text": "".join(run), "size": run_size})
+                run = []
+            run_size = size
+            run.append(char)
+
+        if run:
+            spans.append({"text": "".join(run), "size": run_size})
+        if spans:
+            lines.append({"spans": spans})
+    finally:
+        textpage.close()
+
+    return [{"type": 0, "lines": lines}]
+
+
+def _init_scan_worker(pdf_path: str, detector: "ChapterDetector") -> None:
+    """
+    Open the source PDF once in a worker process.
+
+    Args:
+        pdf_path: Path to the source PDF file
+        detector: Detector whose thresholds the worker applies
+    """
+    _worker_state["detector"] = detector
+    _worker_state["doc"] = fitz.open(pdf_path)
+
+
+def _scan_worker(page_numbers: range) -> List[Tuple[int, str, float]]:
+    """
+    Scan a run of pages using the worker's open document.
+
+    Args:
+        page_numbers: 0-based page numbers to scan
+
+    Returns:
+        (page number, heading text, confidence) for each heading found, in page order
+    """
+    detector: ChapterDetector = _worker_state["detector"]
+    doc = _worker_state["doc"]
+    headings: List[Tuple[int, str, float]] = []
+    for page_num in page_numbers:
+        headings.extend(detector._scan_page(doc[page_num]))
+    return headings
+
+
+def _numbered_lines_worker(page_numbers: Sequence[int]) -> List[NumberedLine]:
+    """
+    Read numbered heading lines from a run of pages using the worker's open document.
+
+    Args:
+        page_numbers: 1-based page numbers to read
+
+    Returns:
+        (page number, line text, font size, chapter number) for each line, in page order
+    """
+    detector: ChapterDetector = _worker_state["detector"]
+    doc = _worker_state["doc"]
+    lines: List[NumberedLine] = []
+    for page_number in page_numbers:
+        blocks = detector._page_blocks(doc[page_number - 1])
+        lines.extend(detector._numbered_lines(page_number, blocks))
+    return lines
+
+
+def _page_runs(pages: Sequence[int], workers: int) -> List[Sequence[int]]:
+    """
+    Cut pages into contiguous runs, about four per worker.
+
+    Args:
+        pages: Page numbers in order
+        workers: Number of worker processes
+
+    Returns:
+        Runs covering every page once, in order
+    """
+    # Fewer round trips than one page per task, still balanced across workers
+    run_length = -(-len(pages) // (4 * workers))
+    return [pages[start : start + run_length] for start in range(0, len(pages), run_length)]
 
 
 class ChapterDetector:
     """Detects chapters in PDF files using various strategies."""
 
-    # Common chapter heading patterns
-    CHAPTER_PATTERNS = [
-        r"^Chapter\s+(\d+|[IVXLCDM]+)[\s:.-]*(.*?)$",
-        r"^CHAPTER\s+(\d+|[IVXLCDM]+)[\s:.-]*(.*?)$",
-        r"^(\d+)\.\s+(.+)$",  # Numbered headings like "1. Introduction"
-        r"^Part\s+(\d+|[IVXLCDM]+)[\s:.-]*(.*?)$",
-        r"^PART\s+(\d+|[IVXLCDM]+)[\s:.-]*(.*?)$",
-    ]
-
-    def __init__(self, sensitivity: str = "medium"):
+    # Common chapter heading patterns, matched case-insensitively; override in a
+    # subclass to change them. The first group of each captures the chapter number.
+    CHAPTER_PATTERNS = list(_DEFAULT_CHAPTER_PATTERNS)
+
+    # (font_size_ratio, min_confidence) per sensitivity level
+    _THRESHOLDS = {
+        "low": (1.5, 0.8),
+        "medium": (1.3, 0.6),
+        "high": (1.2, 0.4),
+    }
+
+    def __init__(
+        self,
+        sensitivity: str = "medium",
+        heading_zone: float = 1.0,
+        backend: TextBackend = "pymupdf",
+        max_workers: Optional[int] = 1,
+    ):
         """
         Initialize the detector.
 
         Args:
             sensitivity: Detection sensitivity ('low', 'medium', 'high')
+            heading_zone: Fraction of each page, from the top, searched for headings by
+                heuristic detection (1.0 scans the whole page)
+            backend: Text extraction library for heuristic detection ('pymupdf' or
+                'pdfium', which needs the optional pypdfium2 package)
+            max_workers: Worker processes for heuristic detection (see pdf_splitter.workers)
         """
+        if backend == "pdfium" and pdfium is None:
+            raise ImportError("The pdfium backend requires the pypdfium2 package")
+
         self.sensitivity = sensitivity
+        self.heading_zone = heading_zone
+        self.backend = backend
+        self.max_workers = max_workers
+        self._chapter_patterns = tuple(self.CHAPTER_PATTERNS)
         self._set_thresholds()
 
     def _set_thresholds(self) -> None:
         """Set detection thresholds based on sensitivity."""
-        thresholds = {
-            "low": {"font_size_ratio": 1.5, "min_confidence": 0.8},
-            "medium": {"font_size_ratio": 1.3, "min_confidence": 0.6},
-            "high": {"font_size_ratio": 1.2, "min_confidence": 0.4},
-        }
-        config = thresholds.get(self.sensitivity, thresholds["medium"])
-        self.font_size_ratio = config["font_size_ratio"]
-        self.min_confidence = config["min_confidence"]
+        self.font_size_ratio, self.min_confidence = self._THRESHOLDS.get(
+            self.sensitivity, self._THRESHOLDS["medium"]
+        )
 
     def detect(
-        self, pdf_path: Path, strategy: str = "hybrid", bookmark_level: int = 1
+        self,
+        pdf_path: Union[Path, fitz.Document],
+        strategy: str = "hybrid",
+        bookmark_level: int = 1,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> DetectionResult:
         """
         Detect chapters in a PDF file.
 
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or an already open document (left open)
             strategy: Detection strategy ('bookmarks', 'heuristic', or 'hybrid')
             bookmark_level: Which bookmark level to use as chapters (1=top level, 2=sub-chapters, etc.)
+            progress_callback: Optional callable receiving (done, total) as pages are scanned
 
         Returns:
             DetectionResult containing detected chapters
         """
-        doc = fitz.open(pdf_path)
+        if isinstance(pdf_path, fitz.Document):
+            doc, owns_doc = pdf_path, False
+        else:
+            doc, owns_doc = fitz.open(pdf_path), True
         total_pages = len(doc)
-        has_bookmarks = len(doc.get_toc()) > 0
+        toc = doc.get_toc()
+        has_bookmarks = len(toc) > 0
 
         chapters: List[Chapter] = []
 
         if strategy == "bookmarks" or (strategy == "hybrid" and has_bookmarks):
-            chapters = self._detect_from_bookmarks(doc, bookmark_level)
+            chapters = self._detect_from_bookmarks(doc, bookmark_level, toc)
             strategy_used = "bookmarks"
 
         if not chapters and strategy in ("heuristic", "hybrid"):
-            chapters = self._detect_from_heuristics(doc)
+            chapters = self._detect_from_heuristics(doc, progress_callback)
             strategy_used = "heuristic"
 
         # If still no chapters found, treat entire document as one chapter
@@ -84,7 +444,9 @@ class ChapterDetector:
         else:
             strategy_used = strategy if chapters else "fallback"
 
-        doc.close()
+        # Leave documents opened by the caller open
+        if owns_doc:
+            doc.close()
 
         return DetectionResult(
             chapters=chapters,
@@ -93,18 +455,22 @@ class ChapterDetector:
             has_bookmarks=has_bookmarks,
         )
 
-    def _detect_from_bookmarks(self, doc: fitz.Document, bookmark_level: int = 1) -> List[Chapter]:
+    def _detect_from_bookmarks(
+        self, doc: fitz.Document, bookmark_level: int = 1, toc: Optional[List[list]] = None
+    ) -> List[Chapter]:
         """
         Detect chapters from PDF bookmarks/outline.
 
         Args:
             doc: PyMuPDF document object
             bookmark_level: Which bookmark level to extract (1=top, 2=chapters, etc.)
+            toc: The document's table of contents, if already read
 
         Returns:
             List of detected chapters
         """
-        toc = doc.get_toc()
+        if toc is None:
+            toc = doc.get_toc()
         if not toc:
             return []
 
@@ -112,16 +478,14 @@ class ChapterDetector:
         total_pages = len(doc)
 
         # Filter for specified bookmark level
-        top_level_items = [item for item in toc if item[0] == bookmark_level]
+        items = [(title, page_num) for level, title, page_num in toc if level == bookmark_level]
 
-        for i, (level, title, page_num) in enumerate(top_level_items):
-            start_page = page_num
+        # Each chapter ends just before the next one starts; the last runs to the end
+        next_starts = [page_num for _, page_num in items[1:]]
+        next_starts.append(total_pages + 1)
 
-            # Determine end page (start of next chapter or end of document)
-            if i + 1 < len(top_level_items):
-                end_page = top_level_items[i + 1][2] - 1
-            else:
-                end_page = total_pages
+        for (title, start_page), next_start in zip(items, next_starts):
+            end_page = next_start - 1
 
             if start_page <= end_page:
                 chapters.append(
@@ -129,7 +493,7 @@ class ChapterDetector:
                         title=title.strip(),
                         start_page=start_page,
                         end_page=end_page,
-                        level=level,
+                        level=bookmark_level,
                         detection_method="bookmark",
                         confidence=1.0,
                     )
@@ -137,56 +501,54 @@ class ChapterDetector:
 
         return chapters
 
-    def _detect_from_heuristics(self, doc: fitz.Document) -> List[Chapter]:
+    def _detect_from_heuristics(
+        self, doc: fitz.Document, progress_callback: Optional[ProgressCallback] = None
+    ) -> List[Chapter]:
         """
         Detect chapters using text analysis heuristics.
 
         Args:
             doc: PyMuPDF document object
+            progress_callback: Optional callable receiving (done, total) as pages are scanned
 
         Returns:
             List of detected chapters
         """
         chapters: List[Chapter] = []
-        potential_chapters: List[Tuple[int, str, float]] = []
-
-        # Analyze each page for chapter headings
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            blocks = page.get_text("dict")["blocks"]
-
-            # Look for text blocks that might be chapter headings
-            for block in blocks:
-                if block.get("type") == 0:  # Text block
-                    for line in block.get("lines", []):
-                        for span in line.get("spans", []):
-                            text = span.get("text", "").strip()
-                            font_size = span.get("size", 0)
-
-                            if text and self._is_potential_heading(text, font_size, blocks):
-                                confidence = self._calculate_confidence(text, font_size)
-                                if confidence >= self.min_confidence:
-                                    potential_chapters.append(
-                                        (page_num + 1, text, confidence)  # 1-indexed
-                                    )
-                                break
-
-        # Convert potential chapters to Chapter objects
         total_pages = len(doc)
-        for i, (page_num, title, confidence) in enumerate(potential_chapters):
-            start_page = page_num
 
-            # End page is start of next chapter or end of document
-            if i + 1 < len(potential_chapters):
-                end_page = potential_chapters[i + 1][0] - 1
-            else:
-                end_page = total_pages
+        # Analyze each page for chapter headings; unmodified documents opened from
+        # a file can be reopened by worker processes (PyMuPDF is not thread-safe)
+        if self.backend == "pdfium":
+            potential_chapters = self._scan_with_pdfium(doc, progress_callback)
+        elif (
+            total_pages >= _PARALLEL_MIN_PAGES
+            and doc.name
+            and not doc.is_dirty
+            and worker_count(self.max_workers) > 1
+        ):
+            potential_chapters = self._scan_in_processes(doc.name, total_pages, progress_callback)
+        else:
+            potential_chapters = []
+            for page_num in range(total_pages):
+                potential_chapters.extend(self._scan_page(doc[page_num]))
+                if progress_callback:
+                    progress_callback(page_num + 1, total_pages)
+
+        # Fill gaps in the chapter numbering the span-by-span scan could not see
+        potential_chapters = self._hunt_missing_chapters(doc, potential_chapters)
 
+        # Convert potential chapters to Chapter objects; each ends just before
+        # the next one starts and the last runs to the end of the document
+        next_starts = [page_num for page_num, _, _ in potential_chapters[1:]]
+        next_starts.append(total_pages + 1)
+
+        for (start_page, title, confidence), next_start in zip(potential_chapters, next_starts):
             chapters.append(
                 Chapter(
                     title=title,
                     start_page=start_page,
-                    end_page=end_page,
+                    end_page=next_start - 1,
                     detection_method="heuristic",
                     confidence=confidence,
                 )
@@ -194,25 +556,318 @@ class ChapterDetector:
 
         return chapters
 
-    def _is_potential_heading(self, text: str, font_size: float, all_blocks: list) -> bool:
+    def _scan_in_processes(
+        self,
+        pdf_path: str,
+        total_pages: int,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> List[Tuple[int, str, float]]:
+        """
+        Scan pages in a process pool, each worker opening the source PDF once.
+
+        Args:
+            pdf_path: Path to the source PDF file
+            total_pages: Number of pages in the document
+            progress_callback: Optional callable receiving (done, total) after each page run
+
+        Returns:
+            (page number, heading text, confidence) for each heading found, in page order
+        """
+        workers = min(worker_count(self.max_workers), total_pages)
+        runs = _page_runs(range(total_pages), workers)
+
+        potential_chapters: List[Tuple[int, str, float]] = []
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_scan_worker, initargs=(pdf_path, self)
+        ) as executor:
+            # map yields results in run order, so headings stay in page order
+            for run, headings in zip(runs, executor.map(_scan_worker, runs)):
+                potential_chapters.extend(headings)
+                if progress_callback:
+                    progress_callback(run[-1] + 1, total_pages)
+
+        return potential_chapters
+
+    def _scan_with_pdfium(
+        self, doc: fitz.Document, progress_callback: Optional[ProgressCallback] = None
+    ) -> List[Tuple[int, str, float]]:
+        """
+        Find potential chapter headings on every page using PDFium for text extraction.
+
+        Args:
+            doc: PyMuPDF document object, reopened by PDFium from its file when possible
+            progress_callback: Optional callable receiving (done, total) as pages are scanned
+
+        Returns:
+            (page number, heading text, confidence) for each heading found, in page order
+        """
+        total_pages = len(doc)
+        potential_chapters: List[Tuple[int, str, float]] = []
+        for page_number, blocks in self._pdfium_blocks(doc, range(1, total_pages + 1)):
+            potential_chapters.extend(self._find_headings(page_number, blocks))
+            if progress_callback:
+                progress_callback(page_number, total_pages)
+
+        return potential_chapters
+
+    def _pdfium_blocks(
+        self, doc: fitz.Document, page_numbers: Iterable[int]
+    ) -> Iterator[Tuple[int, list]]:
+        """
+        Extract the heading-zone text blocks of pages with PDFium.
+
+        Args:
+            doc: PyMuPDF document object, reopened by PDFium from its file when possible
+            page_numbers: 1-based page numbers to read, in order
+
+        Yields:
+            (page number, text blocks in PyMuPDF "dict" layout) for each page
+        """
+        source = doc.name if doc.name and not doc.is_dirty else doc.tobytes()
+        pdf = pdfium.PdfDocument(source)
+        try:
+            for page_number in page_numbers:
+                page = pdf[page_number - 1]
+                try:
+                    blocks = _pdfium_page_blocks(page, self.heading_zone)
+                finally:
+                    page.close()
+                yield page_number, blocks
+        finally:
+            pdf.close()
+
+    def _scan_page(self, page: fitz.Page) -> List[Tuple[int, str, float]]:
+        """
+        Find potential chapter headings on a single page.
+
+        Args:
+            page: PyMuPDF page object
+
+        Returns:
+            (page number, heading text, confidence) for each heading found
+        """
+        return self._find_headings(page.number + 1, self._page_blocks(page))  # 1-indexed
+
+    def _page_blocks(self, page: fitz.Page) -> list:
+        """
+        Extract the text blocks inside the heading zone of a page.
+
+        Args:
+            page: PyMuPDF page object
+
+        Returns:
+            Text blocks in PyMuPDF "dict" layout
+        """
+        # Restricting extraction to the top of the page lets MuPDF drop the rest natively
+        clip = None
+        if self.heading_zone < 1.0:
+            rect = page.rect
+            clip = fitz.Rect(rect.x0, rect.y0, rect.x1, rect.y0 + rect.height * self.heading_zone)
+
+        blocks: list = page.get_text("dict", flags=_HEURISTIC_TEXT_FLAGS, clip=clip)["blocks"]
+        return blocks
+
+    def _hunt_missing_chapters(
+        self, doc: fitz.Document, potential_chapters: List[Tuple[int, str, float]]
+    ) -> List[Tuple[int, str, float]]:
+        """
+        Look again for numbered chapters missing from the sequence found by the page scan.
+
+        The scan reads one span at a time, so a heading split across spans (for example
+        "Chapter" and "3" set in different fonts) is missed. The pages of the chapters
+        either side of a gap, and every page between them, are re-read with each line's
+        spans joined together.
+
+        Args:
+            doc: PyMuPDF document object
+            potential_chapters: (page number, heading text, confidence) from the page scan
+
+        Returns:
+            The potential chapters with any recovered headings added, in page order
+        """
+        heading_re = self._heading_re
+        found = [
+            (page_number, _heading_number(text, heading_re))
+            for page_number, text, _ in potential_chapters
+        ]
+        pages = [page_number for page_number, number in found if number is not None]
+        numbers = [number for _, number in found if number is not None]
+
+        missing = set(_find_missing_chapter_numbers(numbers))
+        if not missing:
+            return potential_chapters
+
+        # Chapter numbers that may turn up on each page left to re-read
+        wanted: Dict[int, Set[int]] = {}
+        run = _increasing_run(numbers)
+        for lower, upper in zip(run, run[1:]):
+            gap = missing.intersection(range(numbers[lower] + 1, numbers[upper]))
+            if not gap:
+                continue
+            for page_number in range(pages[lower], pages[upper] + 1):
+                wanted.setdefault(page_number, set()).update(gap)
+
+        # Boundary pages are re-read too, so skip lines the page scan already kept
+        seen = {(page_number, text) for page_number, text, _ in potential_chapters}
+        recovered: List[Tuple[int, str, float, int]] = []
+        for page_number, text, font_size, number in self._read_numbered_lines(doc, sorted(wanted)):
+            if number not in wanted[page_number] or number not in missing:
+                continue
+            if (page_number, text) in seen:
+                continue
+            confidence = self._calculate_confidence(text, font_size)
+            if confidence >= self.min_confidence:
+                recovered.append((page_number, text, confidence, number))
+                missing.discard(number)
+
+        if not recovered:
+            return potential_chapters
+
+        # Each recovered heading goes before the first later page, or the first heading
+        # on its own page numbered above it, so shared pages keep chapter order
+        merged = list(zip(potential_chapters, (number for _, number in found)))
+        for page_number, text, confidence, number in recovered:
+            index = next(
+                (
+                    index
+                    for index, ((other_page, _, _), other_number) in enumerate(merged)
+                    if other_page > page_number
+                    or (
+                        other_page == page_number
+                        and other_number is not None
+                        and other_number > number
+                    )
+                ),
+                len(merged),
+            )
+            merged.insert(index, ((page_number, text, confidence), number))
+        return [heading for heading, _ in merged]
+
+    def _read_numbered_lines(
+        self, doc: fitz.Document, page_numbers: List[int]
+    ) -> List[NumberedLine]:
+        """
+        Read numbered heading lines from pages with the configured backend.
+
+        Args:
+            doc: PyMuPDF document object
+            page_numbers: 1-based page numbers to read, in order
+
+        Returns:
+            (page number, line text, font size, chapter number) for each line, in page order
+        """
+        lines: List[NumberedLine] = []
+        if self.backend == "pdfium":
+            for page_number, blocks in self._pdfium_blocks(doc, page_numbers):
+                lines.extend(self._numbered_lines(page_number, blocks))
+        elif (
+            len(page_numbers) >= _PARALLEL_MIN_PAGES
+            and doc.name
+            and not doc.is_dirty
+            and worker_count(self.max_workers) > 1
+        ):
+            workers = min(worker_count(self.max_workers), len(page_numbers))
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_scan_worker, initargs=(doc.name, self)
+            ) as executor:
+                for run_lines in executor.map(
+                    _numbered_lines_worker, _page_runs(page_numbers, workers)
+                ):
+                    lines.extend(run_lines)
+        else:
+            for page_number in page_numbers:
+                blocks = self._page_blocks(doc[page_number - 1])
+                lines.extend(self._numbered_lines(page_number, blocks))
+        return lines
+
+    def _numbered_lines(self, page_number: int, blocks: list) -> List[NumberedLine]:
+        """
+        Join each text line's spans and keep the lines that read as numbered headings.
+
+        Args:
+            page_number: Page number (1-indexed)
+            blocks: Text blocks in PyMuPDF "dict" layout
+
+        Returns:
+            (page number, line text, font size, chapter number) for each such line
+        """
+        heading_re = self._heading_re
+        lines: List[NumberedLine] = []
+        for block in blocks:
+            if block["type"] != 0:  # Not a text block
+                continue
+            for line in block["lines"]:
+                spans = line["spans"]
+                if not spans:
+                    continue
+                text = "".join(span["text"] for span in spans).strip()
+                number = _heading_number(text, heading_re)
+                if number is not None:
+                    lines.append((page_number, text, max(span["size"] for span in spans), number))
+        return lines
+
+    def _find_headings(self, page_number: int, blocks: list) -> List[Tuple[int, str, float]]:
+        """
+        Find potential chapter headings among a page's text blocks.
+
+        Args:
+            page_number: 1-based number of the page the blocks come from
+            blocks: Text blocks in PyMuPDF "dict" layout
+
+        Returns:
+            (page number, heading text, confidence) for each heading found
+        """
+        headings: List[Tuple[int, str, float]] = []
+        avg_font_size = self._get_average_font_size(blocks)
+        heading_font_size = avg_font_size * self.font_size_ratio
+        # The prefilter below knows the words that open the default patterns only
+        prefilter = self._chapter_patterns == _DEFAULT_CHAPTER_PATTERNS
+
+        # Look for text blocks that might be chapter headings; MuPDF always
+        # fills in these keys, so index directly instead of dict.get()
+        for block in blocks:
+            if block["type"] == 0:  # Text block
+                for line in block["lines"]:
+                    for span in line["spans"]:
+                        text = span["text"].strip()
+                        font_size = span["size"]
+
+                        # Body-size text can only be a heading if it matches a chapter
+                        # pattern, which needs a digit or "chapter"/"part" up front
+                        if (
+                            prefilter
+                            and font_size < heading_font_size
+                            and text
+                            and not text[0].isdigit()
+                            and text[:4].lower() not in _HEADING_WORD_PREFIXES
+                        ):
+                            continue
+
+                        if text and self._is_potential_heading(text, font_size, avg_font_size):
+                            confidence = self._calculate_confidence(text, font_size)
+                            if confidence >= self.min_confidence:
+                                headings.append((page_number, text, confidence))
+                            break
+
+        return headings
+
+    def _is_potential_heading(self, text: str, font_size: float, avg_font_size: float) -> bool:
         """
         Determine if text is likely a chapter heading.
 
         Args:
             text: The text to analyze
             font_size: Font size of the text
-            all_blocks: All text blocks on the page
+            avg_font_size: Average font size of the text on the page
 
         Returns:
             True if text is likely a heading
         """
         # Check for chapter patterns
-        for pattern in self.CHAPTER_PATTERNS:
-            if re.match(pattern, text, re.IGNORECASE):
-                return True
+        if self._heading_re.match(text):
+            return True
 
         # Check if font size is significantly larger than body text
-        avg_font_size = self._get_average_font_size(all_blocks)
         if avg_font_size > 0 and font_size >= avg_font_size * self.font_size_ratio:
             # Additional check: heading shouldn't be too long
             if len(text.split()) <= 10:
@@ -220,6 +875,11 @@ class ChapterDetector:
 
         return False
 
+    @property
+    def _heading_re(self) -> Any:
+        """Compiled union of CHAPTER_PATTERNS as they were when the detector was created."""
+        return _compile_chapter_patterns(self._chapter_patterns)
+
     def _calculate_confidence(self, text: str, font_size: float) -> float:
         """
         Calculate confidence score for a potential chapter heading.
@@ -231,28 +891,12 @@ class ChapterDetector:
         Returns:
             Confidence score between 0.0 and 1.0
         """
-        confidence = 0.5  # Base confidence
-
-        # Boost confidence for explicit chapter patterns
-        for pattern in self.CHAPTER_PATTERNS:
-            if re.match(pattern, text, re.IGNORECASE):
-                confidence += 0.4
-                break
-
-        # Boost for larger font sizes
-        if font_size >= 16:
-            confidence += 0.1
-        elif font_size >= 14:
-            confidence += 0.05
-
-        # Reduce confidence for very long headings
-        word_count = len(text.split())
-        if word_count > 10:
-            confidence -= 0.2
-        elif word_count > 6:
-            confidence -= 0.1
+        return _heading_confidence(text, font_size, self._heading_re)
 
-        return min(1.0, max(0.0, confidence))
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop memoized confidence scores, e.g. between books in a long-running process."""
+        _heading_confidence.cache_clear()
 
     def _get_average_font_size(self, blocks: list) -> float:
         """
@@ -264,13 +908,17 @@ class ChapterDetector:
         Returns:
             Average font size
         """
-        sizes = []
+        # Running total instead of collecting every size into a list first
+        total = 0.0
+        count = 0
         for block in blocks:
-            if block.get("type") == 0:
-                for line in block.get("lines", []):
-                    for span in line.get("spans", []):
-                        size = span.get("size", 0)
-                        if size > 0:
-                            sizes.append(size)
-
-        return sum(sizes) / len(sizes) if sizes else 0
+            if block["type"] != 0:  # Skip non-text blocks
+                continue
+            for line in block["lines"]:
+                for span in line["spans"]:
+                    size = span["size"]
+                    if size > 0:
+                        total += size
+                        count += 1
+
+        return total / count if count else 0
@@ -1,10 +1,14 @@
 """Models for representing chapters and detection results."""
 
+import sys
 from dataclasses import dataclass
-from typing import List
+from typing import Any, Dict, List
 
+# Drop the per-instance __dict__ where supported (dataclass slots need Python 3.10+)
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class Chapter:
     """Represents a detected chapter in a PDF."""
 
@@ -25,7 +29,7 @@ class Chapter:
         return f"{self.title} (pages {self.start_page}-{self.end_page})"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DetectionResult:
     """Container for chapter detection results."""
 
@@ -1,17 +1,64 @@
 """PDF splitting functionality."""
 
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 import fitz  # PyMuPDF
 
 from pdf_splitter.models import Chapter
+from pdf_splitter.workers import worker_count
+
+# Characters not allowed in filenames, plus ASCII control characters, mapped to
+# underscores in one pass; shared with the EPUB splitter
+SANITIZE_TABLE = str.maketrans({char: "_" for char in '<>:"/\\|?*' + "".join(map(chr, range(32)))})
+_SANITIZE_RE = re.compile(r"[\s_]+")
+
+# Below this many chapters the pool's startup cost outweighs the parallel writes
+_PARALLEL_MIN_CHAPTERS = 16
+
+# Per-process splitter and open source document, set up once by _init_split_worker
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_split_worker(pdf_path: str, splitter: "PDFSplitter") -> None:
+    """
+    Open the source PDF once in a worker process.
+
+    Args:
+        pdf_path: Path to the source PDF file
+        splitter: Splitter whose output settings the worker uses
+    """
+    _worker_state["splitter"] = splitter
+    _worker_state["doc"] = fitz.open(pdf_path)
+
+
+def _split_worker(chapter: Chapter, index: int, preserve_metadata: bool) -> Path:
+    """
+    Write a single chapter using the worker's open source document.
+
+    Args:
+        chapter: Chapter to write
+        index: Chapter index (1-based)
+        preserve_metadata: Whether to preserve PDF metadata in the output file
+
+    Returns:
+        Path to the created PDF file
+    """
+    splitter: PDFSplitter = _worker_state["splitter"]
+    return splitter._write_chapter(_worker_state["doc"], chapter, index, preserve_metadata)
 
 
 class PDFSplitter:
     """Handles splitting PDF files by chapters."""
 
-    def __init__(self, output_dir: Path, filename_pattern: str = "{index:02d}_{title}.pdf"):
+    def __init__(
+        self,
+        output_dir: Path,
+        filename_pattern: str = "{index:02d}_{title}.pdf",
+        max_workers: Optional[int] = 1,
+    ):
         """
         Initialize the splitter.
 
@@ -23,54 +70,176 @@ class PDFSplitter:
                 - {start}: Start page number
                 - {end}: End page number
                 - {pages}: Number of pages in chapter
+            max_workers: Worker processes for writing chapters (see pdf_splitter.workers)
         """
         self.output_dir = Path(output_dir)
         self.filename_pattern = filename_pattern
+        self.max_workers = max_workers
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def split(
-        self, pdf_path: Path, chapters: List[Chapter], preserve_metadata: bool = True
+        self,
+        pdf_path: Union[Path, fitz.Document],
+        chapters: List[Chapter],
+        preserve_metadata: bool = True,
     ) -> List[Path]:
         """
         Split a PDF file into separate files by chapters.
 
         Args:
-            pdf_path: Path to the source PDF file
+            pdf_path: Path to the source PDF file, or an already open document (left open)
             chapters: List of chapters to split by
             preserve_metadata: Whether to preserve PDF metadata in split files
 
         Returns:
             List of paths to the created PDF files
         """
-        doc = fitz.open(pdf_path)
-        created_files: List[Path] = []
+        if isinstance(pdf_path, fitz.Document):
+            doc, owns_doc = pdf_path, False
+        else:
+            doc, owns_doc = fitz.open(pdf_path), True
 
-        # Get original metadata
-        metadata = doc.metadata if preserve_metadata else {}
+        try:
+            # Workers reopen the source, so only an unmodified document on disk can be shared
+            if (
+                len(chapters) >= _PARALLEL_MIN_CHAPTERS
+                and doc.name
+                and not doc.is_dirty
+                and worker_count(self.max_workers) > 1
+            ):
+                return self._split_in_processes(doc.name, chapters, preserve_metadata)
 
-        for index, chapter in enumerate(chapters, start=1):
-            output_path = self._generate_filename(chapter, index)
+            created_files: List[Path] = []
+            for index, chapter in enumerate(chapters, start=1):
+                created_files.append(self._write_chapter(doc, chapter, index, preserve_metadata))
 
-            # Create new PDF with chapter pages
+            return created_files
+        finally:
+            # Leave documents opened by the caller open
+            if owns_doc:
+                doc.close()
+
+    def write_bookmarked(
+        self,
+        pdf_path: Union[Path, fitz.Document],
+        chapters: List[Chapter],
+        preserve_metadata: bool = True,
+    ) -> Path:
+        """
+        Write all chapters into a single PDF with one bookmark per chapter.
+
+        Pages are copied once into one document, so fonts and other shared
+        resources are stored once instead of in every chapter file.
+
+        Args:
+            pdf_path: Path to the source PDF file, or an already open document (left open)
+            chapters: List of chapters to include, in output order
+            preserve_metadata: Whether to preserve PDF metadata in the output file
+
+        Returns:
+            Path to the created PDF file
+        """
+        if isinstance(pdf_path, fitz.Document):
+            doc, owns_doc = pdf_path, False
+        else:
+            doc, owns_doc = fitz.open(pdf_path), True
+
+        try:
+            output_path = self.output_dir / f"{Path(doc.name).stem or 'document'}_bookmarked.pdf"
             new_doc = fitz.open()
+            toc: List[list] = []
 
-            # Insert pages (PyMuPDF uses 0-based indexing)
-            new_doc.insert_pdf(doc, from_page=chapter.start_page - 1, to_page=chapter.end_page - 1)
+            last_index = len(chapters)
+            for index, chapter in enumerate(chapters, start=1):
+                toc.append([1, chapter.title, new_doc.page_count + 1])
+                # Keep the source's graft map across inserts so objects shared
+                # between chapters are copied once
+                new_doc.insert_pdf(
+                    doc,
+                    from_page=chapter.start_page - 1,
+                    to_page=chapter.end_page - 1,
+                    final=index == last_index,
+                )
 
-            # Set metadata
+            new_doc.set_toc(toc)
             if preserve_metadata:
-                new_doc.set_metadata(metadata)
-                # Add chapter-specific title
-                new_doc.set_metadata({"title": chapter.title})
+                new_doc.set_metadata(doc.metadata)
 
-            # Save the new PDF
-            new_doc.save(output_path)
+            # Drop unreferenced objects and compress streams in a single save
+            new_doc.save(output_path, garbage=4, clean=True, deflate=True)
             new_doc.close()
 
-            created_files.append(output_path)
+            return output_path
+        finally:
+            # Leave documents opened by the caller open
+            if owns_doc:
+                doc.close()
+
+    def _split_in_processes(
+        self, pdf_path: str, chapters: List[Chapter], preserve_metadata: bool
+    ) -> List[Path]:
+        """
+        Write chapters in a process pool, each worker opening the source PDF once.
+
+        Args:
+            pdf_path: Path to the source PDF file
+            chapters: List of chapters to split by
+            preserve_metadata: Whether to preserve PDF metadata in split files
+
+        Returns:
+            List of paths to the created PDF files, in chapter order
+        """
+        workers = min(worker_count(self.max_workers), len(chapters))
+        # About four batches per worker: fewer round trips, still balanced at the end
+        chunksize = max(1, len(chapters) // (4 * workers))
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_split_worker, initargs=(pdf_path, self)
+        ) as executor:
+            return list(
+                executor.map(
+                    _split_worker,
+                    chapters,
+                    range(1, len(chapters) + 1),
+                    repeat(preserve_metadata),
+                    chunksize=chunksize,
+                )
+            )
+
+    def _write_chapter(
+        self, doc: fitz.Document, chapter: Chapter, index: int, preserve_metadata: bool
+    ) -> Path:
+        """
+        Copy one chapter's pages from the source document into a new PDF file.
+
+        Args:
+            doc: Open source document
+            chapter: Chapter to write
+            index: Chapter index (1-based)
+            preserve_metadata: Whether to preserve PDF metadata in the output file
+
+        Returns:
+            Path to the created PDF file
+        """
+        output_path = self._generate_filename(chapter, index)
+
+        # Create new PDF with chapter pages
+        new_doc = fitz.open()
+
+        # Insert pages (PyMuPDF uses 0-based indexing)
+        new_doc.insert_pdf(doc, from_page=chapter.start_page - 1, to_page=chapter.end_page - 1)
+
+        # Set metadata, with a chapter-specific title, in one update: each
+        # set_metadata call rebuilds the document's Info dictionary
+        if preserve_metadata:
+            new_doc.set_metadata({**doc.metadata, "title": chapter.title})
+
+        # Save the new PDF; by default streams are written as copied, without
+        # the garbage collection and deflate passes that dominate save time
+        new_doc.save(output_path)
+        new_doc.close()
 
-        doc.close()
-        return created_files
+        return output_path
 
     def _generate_filename(self, chapter: Chapter, index: int) -> Path:
         """
@@ -114,12 +283,10 @@ class PDFSplitter:
             Sanitized filename-safe string
         """
         # Remove or replace invalid characters
-        invalid_chars = r'<>:"/\|?*'
-        for char in invalid_chars:
-            title = title.replace(char, "_")
+        title = title.translate(SANITIZE_TABLE)
 
         # Replace multiple spaces/underscores with single underscore
-        title = re.sub(r"[\s_]+", "_", title)
+        title = _SANITIZE_RE.sub("_", title)
 
         # Remove leading/trailing underscores
         title = title.strip("_")
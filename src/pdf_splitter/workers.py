@@ -0,0 +1,40 @@
+"""
+Worker process settings shared by the PDF and EPUB detectors and splitters.
+
+Every max_workers argument takes 1 (the default) to stay in the calling process,
+a larger number for that many worker processes, or None for one per usable CPU.
+Where workers are spawned rather than forked (Windows, macOS), running more than
+one requires the calling script to guard its entry point with
+if __name__ == "__main__".
+"""
+
+import os
+from typing import Optional
+
+
+def usable_cpu_count() -> int:
+    """
+    Count the CPUs this process is allowed to run on.
+
+    Returns:
+        Size of the scheduler affinity mask where the platform has one, which respects
+        container and taskset limits; otherwise os.cpu_count()
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def worker_count(max_workers: Optional[int]) -> int:
+    """
+    Resolve a max_workers setting to a number of processes.
+
+    Args:
+        max_workers: Requested worker processes, or None for one per usable CPU
+
+    Returns:
+        Number of processes to use, at least 1
+    """
+    if max_workers is None:
+        return usable_cpu_count()
+    return max(1, max_workers)
@@ -0,0 +1,107 @@
+"""Tests for the command-line interfaces."""
+
+import fitz
+from click.testing import CliRunner
+from ebooklib import epub
+from epub_splitter.cli import main as epub_main
+from pdf_splitter.cli import main as pdf_main
+
+
+class TestPdfCli:
+    """Test cases for the pdf-splitter commands."""
+    
+    def test_heading_zone_option(self, tmp_path):
+        """Test --heading-zone limits heuristic detection to the top of each page."""
+        pdf_path = tmp_path / "zones.pdf"
+        doc = fitz.open()
+        for number, y in ((1, 72), (2, 700), (3, 150)):
+            page = doc.new_page()
+            page.insert_text((72, y), f"Chapter {number}: Title", fontsize=20)
+            page.insert_text((72, 400), "Body text on the page.", fontsize=12)
+        doc.save(pdf_path)
+        doc.close()
+        
+        runner = CliRunner()
+        result = runner.invoke(
+            pdf_main,
+            ["preview", str(pdf_path), "--strategy", "heuristic", "--heading-zone", "0.25"],
+        )
+        assert result.exit_code == 0
+        assert "Heading Zone: top 25% of each page" in result.output
+        assert "Chapter 1: Title" in result.output
+        assert "Chapter 2: Title" not in result.output
+        assert "Chapter 3: Title" in result.output
+        
+        result = runner.invoke(pdf_main, ["preview", str(pdf_path), "--heading-zone", "0"])
+        assert result.exit_code == 2
+
+    
+    def test_bookmarked_mode_rejects_pattern(self, tmp_path):
+        """Test --pattern is refused with --mode bookmarked, whose file name is fixed."""
+        pdf_path = tmp_path / "book.pdf"
+        doc = fitz.open()
+        for number in range(1, 3):
+            doc.new_page().insert_text((72, 72), f"Chapter {number}: Title", fontsize=20)
+        doc.save(pdf_path)
+        doc.close()
+        
+        runner = CliRunner()
+        output_dir = tmp_path / "out"
+        result = runner.invoke(
+            pdf_main,
+            ["split", str(pdf_path), "-o", str(output_dir), "--mode", "bookmarked", "--pattern", "{index}.pdf"],
+        )
+        assert result.exit_code == 2
+        assert "--pattern cannot be used with --mode bookmarked" in result.output
+        assert not output_dir.exists()
+        
+        result = runner.invoke(
+            pdf_main, ["split", str(pdf_path), "-o", str(output_dir), "--mode", "bookmarked"], input="y\n"
+        )
+        assert result.exit_code == 0
+        assert (output_dir / "book_bookmarked.pdf").exists()
+
+
+class TestEpubCli:
+    """Test cases for the epub-splitter commands."""
+    
+    def test_no_cache_option(self, tmp_path, monkeypatch):
+        """Test --no-cache neither reads nor writes the detection cache."""
+        book = epub.EpubBook()
+        book.set_identifier("cli-book")
+        book.set_title("CLI Book")
+        book.set_language("en")
+        documents = []
+        for number in (1, 2):
+            document = epub.EpubHtml(
+                title=f"Chapter {number}", file_name=f"chapter_{number}.xhtml", lang="en"
+            )
+            document.content = f"<h1>Chapter {number}</h1><p>Text.</p>"
+            book.add_item(document)
+            documents.append(document)
+        book.toc = documents
+        book.add_item(epub.EpubNcx())
+        book.add_item(epub.EpubNav())
+        book.spine = ["nav"] + documents
+        epub_path = tmp_path / "book.epub"
+        epub.write_epub(str(epub_path), book)
+        
+        cache_dir = tmp_path / "cache" / "epub-splitter"
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        runner = CliRunner()
+        
+        result = runner.invoke(epub_main, ["preview", str(epub_path)])
+        assert result.exit_code == 0
+        assert len(list(cache_dir.glob("*.json"))) == 1
+        
+        def no_cache_read(cache_file):
+            raise AssertionError("cache read")
+        
+        monkeypatch.setattr("epub_splitter.detector._load_cached_result", no_cache_read)
+        for cache_file in cache_dir.glob("*.json"):
+            cache_file.unlink()
+        
+        result = runner.invoke(epub_main, ["preview", str(epub_path), "--no-cache"])
+        assert result.exit_code == 0
+        assert "Chapter 2" in result.output
+        assert not list(cache_dir.glob("*.json"))
@@ -2,7 +2,8 @@
 
 import pytest
 from pathlib import Path
-from pdf_splitter.detector import ChapterDetector
+import fitz
+from pdf_splitter.detector import ChapterDetector, _find_missing_chapter_numbers
 from pdf_splitter.models import Chapter, DetectionResult
 
 
@@ -57,6 +58,200 @@ class TestChapterDetector:
         # Lower confidence for non-chapter text
         confidence = detector._calculate_confidence("Some regular paragraph text here", 12)
         assert confidence < 0.8
+    
+    def test_find_missing_chapter_numbers(self):
+        """Test gaps in the chapter numbering are reported."""
+        assert _find_missing_chapter_numbers([1, 2, 4, 5]) == [3]
+        
+        # Out-of-sequence matches do not count as chapters
+        assert _find_missing_chapter_numbers([1, 2, 42, 4, 5, 7]) == [3, 6]
+        assert _find_missing_chapter_numbers([5, 6, 7, 1]) == []
+        assert _find_missing_chapter_numbers([10, 11, 2, 12]) == []
+        assert _find_missing_chapter_numbers([3, 4, 1]) == []
+        assert _find_missing_chapter_numbers([]) == []
+    
+    def test_heuristics_recover_heading_split_across_spans(self, tmp_path):
+        """Test a chapter missing from the numbering is found by joining line spans."""
+        pdf_path = tmp_path / "split_heading.pdf"
+        doc = fitz.open()
+        for number in range(1, 6):
+            page = doc.new_page()
+            if number == 3:
+                # "Chapter " and "3: ..." in different fonts become separate spans
+                page.insert_text((72, 72), "Chapter ", fontname="helv", fontsize=12)
+                offset = fitz.get_text_length("Chapter ", fontname="helv", fontsize=12)
+                page.insert_text((72 + offset, 72), "3: Gamma", fontname="tiro", fontsize=12)
+            else:
+                page.insert_text((72, 72), f"Chapter {number}: Title", fontsize=12)
+            for line in range(10):
+                page.insert_text((72, 120 + line * 16), "Body text on the page.", fontsize=12)
+        doc.save(pdf_path)
+        doc.close()
+        
+        result = ChapterDetector().detect(pdf_path, strategy="heuristic")
+        
+        assert [chapter.title for chapter in result.chapters] == [
+            "Chapter 1: Title",
+            "Chapter 2: Title",
+            "Chapter 3: Gamma",
+            "Chapter 4: Title",
+            "Chapter 5: Title",
+        ]
+        assert [chapter.start_page for chapter in result.chapters] == [1, 2, 3, 4, 5]
+    
+    @pytest.mark.parametrize("backend", ["pymupdf", "pdfium"])
+    def test_heuristics_recover_split_heading_on_boundary_page(self, tmp_path, backend):
+        """Test a split heading sharing a page with a found chapter is recovered in order."""
+        if backend == "pdfium":
+            pytest.importorskip("pypdfium2")
+        
+        pdf_path = tmp_path / "shared_page.pdf"
+        doc = fitz.open()
+        for number in (1, 2, 4, 5):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"Chapter {number}: Title", fontsize=12)
+            for line in range(10):
+                page.insert_text((72, 120 + line * 16), "Body text on the page.", fontsize=12)
+            if number == 2:
+                # Chapter 3 starts lower down the page chapter 2 starts on, its
+                # number in a larger size so every backend sees two spans
+                page.insert_text((72, 400), "Chapter ", fontname="helv", fontsize=12)
+                offset = fitz.get_text_length("Chapter ", fontname="helv", fontsize=12)
+                page.insert_text((72 + offset, 400), "3: Gamma", fontname="tiro", fontsize=14)
+                for line in range(10):
+                    page.insert_text((72, 440 + line * 16), "Body text on the page.", fontsize=12)
+        doc.save(pdf_path)
+        doc.close()
+        
+        result = ChapterDetector(backend=backend).detect(pdf_path, strategy="heuristic")
+        
+        assert [(chapter.title, chapter.start_page) for chapter in result.chapters] == [
+            ("Chapter 1: Title", 1),
+            ("Chapter 2: Title", 2),
+            ("Chapter 3: Gamma", 2),
+            ("Chapter 4: Title", 3),
+            ("Chapter 5: Title", 4),
+        ]
+    
+    def test_missing_chapter_hunt_runs_in_worker_processes(self, tmp_path, monkeypatch):
+        """Test re-reading gap pages in worker processes recovers the same chapters."""
+        pdf_path = tmp_path / "sparse.pdf"
+        doc = fitz.open()
+        for number in range(1, 9):
+            page = doc.new_page()
+            if number in (1, 8):
+                page.insert_text((72, 72), f"Chapter {number}: Title", fontsize=12)
+            else:
+                page.insert_text((72, 72), "Chapter ", fontname="helv", fontsize=12)
+                offset = fitz.get_text_length("Chapter ", fontname="helv", fontsize=12)
+                page.insert_text((72 + offset, 72), f"{number}: Part", fontname="tiro", fontsize=14)
+            page.insert_text((72, 120), "Body text on the page.", fontsize=12)
+        doc.save(pdf_path)
+        doc.close()
+        
+        serial = ChapterDetector().detect(pdf_path, strategy="heuristic")
+        assert [chapter.start_page for chapter in serial.chapters] == list(range(1, 9))
+        
+        monkeypatch.setattr("pdf_splitter.detector._PARALLEL_MIN_PAGES", 2)
+        parallel = ChapterDetector(max_workers=2).detect(pdf_path, strategy="heuristic")
+        assert parallel.chapters == serial.chapters
+    
+    def test_pdfium_backend_hunts_with_pdfium(self, tmp_path, monkeypatch):
+        """Test the missing-chapter pass reads pages with the selected backend."""
+        pytest.importorskip("pypdfium2")
+        
+        def no_pymupdf(page):
+            raise AssertionError("page read with PyMuPDF")
+        
+        monkeypatch.setattr(ChapterDetector, "_page_blocks", no_pymupdf)
+        
+        pdf_path = tmp_path / "split_heading.pdf"
+        doc = fitz.open()
+        for number in range(1, 4):
+            page = doc.new_page()
+            if number == 2:
+                page.insert_text((72, 72), "Chapter ", fontname="helv", fontsize=12)
+                offset = fitz.get_text_length("Chapter ", fontname="helv", fontsize=12)
+                page.insert_text((72 + offset, 72), "2: Beta", fontname="tiro", fontsize=14)
+            else:
+                page.insert_text((72, 72), f"Chapter {number}: Title", fontsize=12)
+            page.insert_text((72, 120), "Body text on the page.", fontsize=12)
+        doc.save(pdf_path)
+        doc.close()
+        
+        result = ChapterDetector(backend="pdfium").detect(pdf_path, strategy="heuristic")
+        assert [chapter.start_page for chapter in result.chapters] == [1, 2, 3]
+    
+    def test_chapter_patterns_can_be_overridden(self, tmp_path):
+        """Test a subclass's CHAPTER_PATTERNS decide which lines are headings."""
+        class LessonDetector(ChapterDetector):
+            CHAPTER_PATTERNS = [r"^Lesson\s+(\d+)$"]
+        
+        pdf_path = tmp_path / "lessons.pdf"
+        doc = fitz.open()
+        for number in range(1, 4):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"Lesson {number}", fontsize=12)
+            page.insert_text((72, 120), "Body text on the page.", fontsize=12)
+        doc.save(pdf_path)
+        doc.close()
+        
+        assert ChapterDetector().detect(pdf_path, strategy="heuristic").strategy_used == "fallback"
+        
+        result = LessonDetector().detect(pdf_path, strategy="heuristic")
+        assert [chapter.title for chapter in result.chapters] == ["Lesson 1", "Lesson 2", "Lesson 3"]
+    
+    def test_heading_zone_limits_where_headings_are_found(self, tmp_path):
+        """Test headings below the heading zone are dropped and those inside it kept."""
+        pdf_path = tmp_path / "zones.pdf"
+        doc = fitz.open()
+        for number, y in ((1, 72), (2, 700), (3, 150)):
+            page = doc.new_page()  # 842pt tall, so 0.25 covers the top 210pt
+            page.insert_text((72, y), f"Chapter {number}: Title", fontsize=20)
+            page.insert_text((72, 400), "Body text on the page.", fontsize=12)
+        doc.save(pdf_path)
+        doc.close()
+        
+        whole_page = ChapterDetector().detect(pdf_path, strategy="heuristic")
+        assert [chapter.start_page for chapter in whole_page.chapters] == [1, 2, 3]
+        
+        top_quarter = ChapterDetector(heading_zone=0.25).detect(pdf_path, strategy="heuristic")
+        assert [chapter.title for chapter in top_quarter.chapters] == [
+            "Chapter 1: Title",
+            "Chapter 3: Title",
+        ]
+        assert [chapter.start_page for chapter in top_quarter.chapters] == [1, 3]
+    
+    def test_pdfium_backend_matches_pymupdf(self, tmp_path):
+        """Test the pdfium text backend detects the same chapters as PyMuPDF."""
+        pytest.importorskip("pypdfium2")
+        
+        pdf_path = tmp_path / "backends.pdf"
+        doc = fitz.open()
+        for number in range(1, 7):
+            page = doc.new_page()
+            title = f"Chapter {number}: Topic {number}" if number % 2 else f"{number}. Topic"
+            page.insert_text((72, 80), title, fontsize=20)
+            for line in range(30):
+                page.insert_text((72, 120 + line * 14), "Body text line here.", fontsize=10)
+            doc.new_page().insert_text((72, 80), "More body text.", fontsize=10)
+        doc.save(pdf_path)
+        doc.close()
+        
+        for heading_zone in (1.0, 0.25):
+            expected = ChapterDetector(heading_zone=heading_zone).detect(
+                pdf_path, strategy="heuristic"
+            )
+            result = ChapterDetector(heading_zone=heading_zone, backend="pdfium").detect(
+                pdf_path, strategy="heuristic"
+            )
+            assert expected.chapter_count == 6
+            assert [
+                (chapter.title, chapter.start_page, chapter.end_page) for chapter in result.chapters
+            ] == [
+                (chapter.title, chapter.start_page, chapter.end_page)
+                for chapter in expected.chapters
+            ]
 
 
 # Fixtures for integration tests (would require actual PDF files)
@@ -84,6 +279,5 @@ class TestIntegration:
         created_files = splitter.split(sample_pdf_path, result.chapters)
         
         assert len(created_files) == result.chapter_count
-        for file_path in created_files:
-            assert file_path.exists()
-            assert file_path.suffix == ".pdf"
+        assert all(map(Path.exists, created_files))
+        assert {file_path.suffix for file_path in created_files} == {".pdf"}
@@ -0,0 +1,351 @@
+"""Unit tests for EPUB chapter detection."""
+
+import os
+import zipfile
+import pytest
+from ebooklib import epub
+from epub_splitter.detector import EpubChapterDetector
+
+
+CONTAINER_XML = """<?xml version="1.0" encoding="utf-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="{opf_path}" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>"""
+
+
+def chapter_xhtml(number):
+    """Build a chapter document with a chapter heading and one section heading."""
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<html xmlns="http://www.w3.org/1999/xhtml"><head><title>Book</title></head><body>'
+        f'<h1 id="c{number}">Chapter {number}</h1><p>Text.</p>'
+        f'<h2 id="s{number}">Section {number}.1</h2><p>Text.</p>'
+        "</body></html>"
+    )
+
+
+def nav_xhtml(entries):
+    """Build an EPUB 3 nav document from (title, href or None, children) entries."""
+    def ordered_list(items):
+        parts = []
+        for title, href, children in items:
+            label = f'<a href="{href}">{title}</a>' if href else f"<span>{title}</span>"
+            parts.append(f"<li>{label}{ordered_list(children) if children else ''}</li>")
+        return f"<ol>{''.join(parts)}</ol>"
+    
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">'
+        f'<head><title>Contents</title></head><body><nav epub:type="toc">{ordered_list(entries)}</nav>'
+        "</body></html>"
+    )
+
+
+def ncx_xml(entries):
+    """Build an NCX document from (title, href, children) entries."""
+    play_order = iter(range(1, 1000))
+    
+    def nav_points(items):
+        parts = []
+        for title, href, children in items:
+            order = next(play_order)
+            parts.append(
+                f'<navPoint id="p{order}" playOrder="{order}">'
+                f"<navLabel><text>{title}</text></navLabel><content src=\"{href}\"/>"
+                f"{nav_points(children) if children else ''}</navPoint>"
+            )
+        return "".join(parts)
+    
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">'
+        '<head><meta name="dtb:uid" content="raw-book"/></head>'
+        f"<docTitle><text>Book</text></docTitle><navMap>{nav_points(entries)}</navMap></ncx>"
+    )
+
+
+def write_raw_epub(path, documents, opf_path="OEBPS/content.opf", nav=None, ncx=None):
+    """
+    Write an EPUB archive by hand so hrefs and paths are exactly as given.
+    
+    Args:
+        path: Output path
+        documents: List of (manifest href, archive name relative to the OPF, content)
+        opf_path: Location of the package document in the archive
+        nav: Optional (href, content) of the EPUB 3 nav document
+        ncx: Optional (href, content) of the NCX
+    """
+    opf_dir = opf_path.rpartition("/")[0]
+    
+    def archive_name(name):
+        return f"{opf_dir}/{name}" if opf_dir else name
+    
+    manifest = []
+    spine = []
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED)
+        archive.writestr("META-INF/container.xml", CONTAINER_XML.format(opf_path=opf_path))
+        for number, (href, name, content) in enumerate(documents, 1):
+            archive.writestr(archive_name(name), content)
+            manifest.append(
+                f'<item id="doc{number}" href="{href}" media-type="application/xhtml+xml"/>'
+            )
+            spine.append(f'<itemref idref="doc{number}"/>')
+        if nav:
+            archive.writestr(archive_name(nav[0]), nav[1])
+            manifest.append(
+                f'<item id="nav" href="{nav[0]}" media-type="application/xhtml+xml" properties="nav"/>'
+            )
+        spine_toc = ""
+        if ncx:
+            archive.writestr(archive_name(ncx[0]), ncx[1])
+            manifest.append(f'<item id="ncx" href="{ncx[0]}" media-type="application/x-dtbncx+xml"/>')
+            spine_toc = ' toc="ncx"'
+        archive.writestr(
+            opf_path,
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">'
+            '<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">'
+            '<dc:identifier id="uid">raw-book</dc:identifier><dc:title>Book</dc:title>'
+            "<dc:language>en</dc:language></metadata>"
+            f"<manifest>{''.join(manifest)}</manifest>"
+            f"<spine{spine_toc}>{''.join(spine)}</spine></package>",
+        )
+
+
+def two_chapter_toc(prefix=""):
+    """TOC entries for two chapters with one section each, hrefs prefixed by ``prefix``."""
+    return [
+        (
+            f"Chapter {number}",
+            f"{prefix}text/ch{number}.xhtml#c{number}",
+            [(f"Section {number}.1", f"{prefix}text/ch{number}.xhtml#s{number}", [])],
+        )
+        for number in (1, 2)
+    ]
+
+
+TWO_CHAPTERS = [(f"text/ch{n}.xhtml", f"text/ch{n}.xhtml", chapter_xhtml(n)) for n in (1, 2)]
+
+RAW_EPUBS = {
+    "ncx": dict(documents=TWO_CHAPTERS, ncx=("toc.ncx", ncx_xml(two_chapter_toc()))),
+    "nav": dict(documents=TWO_CHAPTERS, nav=("nav.xhtml", nav_xhtml(two_chapter_toc()))),
+    "nav_and_ncx": dict(
+        documents=TWO_CHAPTERS,
+        nav=("nav.xhtml", nav_xhtml(two_chapter_toc())),
+        ncx=("toc.ncx", ncx_xml([("Other", "text/ch2.xhtml", [])])),
+    ),
+    "nested": dict(
+        documents=TWO_CHAPTERS,
+        nav=(
+            "nav.xhtml",
+            nav_xhtml(
+                [
+                    (
+                        "Part",
+                        "text/ch1.xhtml",
+                        [
+                            (
+                                "Chapter 1",
+                                "text/ch1.xhtml#c1",
+                                [("Section 1.1", "text/ch1.xhtml#s1", [("Chapter 2", "text/ch2.xhtml#c2", [])])],
+                            )
+                        ],
+                    )
+                ]
+            ),
+        ),
+    ),
+    "opf_in_subdirectory": dict(
+        documents=TWO_CHAPTERS,
+        opf_path="a/b/package.opf",
+        nav=("nav/toc.xhtml", nav_xhtml(two_chapter_toc("../"))),
+    ),
+    "nav_section_without_href": dict(
+        documents=TWO_CHAPTERS,
+        nav=("nav.xhtml", nav_xhtml([("Part 1", None, two_chapter_toc())])),
+    ),
+}
+
+
+@pytest.fixture
+def two_level_epub_path(tmp_path):
+    """Fixture providing an EPUB whose TOC has chapters (level 1) and sections (level 2)."""
+    book = epub.EpubBook()
+    book.set_identifier("two-level-book")
+    book.set_title("Two Level Book")
+    book.set_language("en")
+    
+    documents = []
+    toc = []
+    for number in range(1, 4):
+        file_name = f"text/chapter_{number}.xhtml"
+        document = epub.EpubHtml(title=f"Chapter {number}", file_name=file_name, lang="en")
+        document.content = (
+            f'<h1 id="c{number}">Chapter {number}</h1>'
+            f'<h2 id="s{number}a">Section {number}.1</h2><p>Text.</p>'
+            f'<h2 id="s{number}b">Section {number}.2</h2><p>Text.</p>'
+        )
+        book.add_item(document)
+        documents.append(document)
+        toc.append(
+            (
+                epub.Section(f"Chapter {number}", href=f"{file_name}#c{number}"),
+                [
+                    epub.Link(f"{file_name}#s{number}a", f"Section {number}.1", f"s{number}a"),
+                    epub.Link(f"{file_name}#s{number}b", f"Section {number}.2", f"s{number}b"),
+                ],
+            )
+        )
+    
+    book.toc = toc
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    book.spine = ["nav"] + documents
+    
+    epub_path = tmp_path / "two_level.epub"
+    epub.write_epub(str(epub_path), book)
+    return epub_path
+
+
+class TestEpubChapterDetector:
+    """Test cases for EpubChapterDetector class."""
+    
+    @pytest.mark.parametrize("strategy", ["native", "hybrid"])
+    @pytest.mark.parametrize("legacy", [False, True])
+    def test_toc_level_falls_back_to_deepest_level(self, two_level_epub_path, strategy, legacy):
+        """Test asking for a TOC level deeper than the TOC uses its deepest level."""
+        detector = EpubChapterDetector(strategy=strategy, toc_level=3, legacy=legacy)
+        result = detector.detect(two_level_epub_path)
+        
+        assert result.strategy_used == "native"
+        assert result.has_toc
+        assert [chapter.title for chapter in result.chapters][:3] == [
+            "Section 1.1",
+            "Section 1.2",
+            "Section 2.1",
+        ]
+        assert result.chapter_count == 6
+        assert {chapter.level for chapter in result.chapters} == {2}
+        assert (result.chapters[0].file_path, result.chapters[0].html_id) == (
+            "text/chapter_1.xhtml",
+            "s1a",
+        )
+    
+    @pytest.mark.parametrize("name", sorted(RAW_EPUBS))
+    @pytest.mark.parametrize("strategy", ["native", "structural", "manifest", "hybrid"])
+    def test_fast_parser_matches_legacy(self, tmp_path, name, strategy):
+        """Test reading the archive directly gives the same chapters as ebooklib."""
+        epub_path = tmp_path / f"{name}.epub"
+        write_raw_epub(epub_path, **RAW_EPUBS[name])
+        
+        def summary(result):
+            return (
+                result.strategy_used,
+                result.total_files,
+                result.has_toc,
+                [
+                    (c.title, c.file_path, c.html_id, c.level, c.detection_method, c.confidence)
+                    for c in result.chapters
+                ],
+            )
+        
+        for toc_level in (1, 2, 3):
+            fast = EpubChapterDetector(strategy=strategy, toc_level=toc_level).detect(epub_path)
+            legacy = EpubChapterDetector(strategy=strategy, toc_level=toc_level, legacy=True)
+            assert summary(fast) == summary(legacy.detect(epub_path))
+            assert fast.chapters
+    
+    def test_fast_parser_resolves_ncx_hrefs_in_subdirectory(self, tmp_path):
+        """Test NCX hrefs are resolved against the NCX's directory, unlike ebooklib."""
+        epub_path = tmp_path / "ncx_in_subdirectory.epub"
+        write_raw_epub(
+            epub_path,
+            TWO_CHAPTERS,
+            opf_path="a/b/package.opf",
+            ncx=("nav/toc.ncx", ncx_xml(two_chapter_toc("../"))),
+        )
+        
+        result = EpubChapterDetector(strategy="native").detect(epub_path)
+        assert [(c.title, c.file_path, c.html_id) for c in result.chapters] == [
+            ("Chapter 1", "text/ch1.xhtml", "c1"),
+            ("Chapter 2", "text/ch2.xhtml", "c2"),
+        ]
+    
+    @pytest.mark.parametrize("toc_format", ["nav", "ncx"])
+    def test_fast_parser_decodes_percent_encoded_hrefs(self, tmp_path, toc_format):
+        """Test percent-encoded TOC hrefs point at the file names ebooklib gives the items."""
+        epub_path = tmp_path / f"percent_{toc_format}.epub"
+        toc = [
+            ("Chapter 1", "text/Chapter%20One.xhtml#c1", []),
+            ("Chapter 2", "text/ch2.xhtml#c2", []),
+        ]
+        toc_document = ("nav.xhtml", nav_xhtml(toc)) if toc_format == "nav" else ("toc.ncx", ncx_xml(toc))
+        write_raw_epub(
+            epub_path,
+            [
+                ("text/Chapter%20One.xhtml", "text/Chapter One.xhtml", chapter_xhtml(1)),
+                ("text/ch2.xhtml", "text/ch2.xhtml", chapter_xhtml(2)),
+            ],
+            **{toc_format: toc_document},
+        )
+        
+        result = EpubChapterDetector(strategy="native").detect(epub_path)
+        file_names = {item.file_name for item in epub.read_epub(str(epub_path)).get_items()}
+        assert [c.file_path for c in result.chapters] == ["text/Chapter One.xhtml", "text/ch2.xhtml"]
+        assert {c.file_path for c in result.chapters} <= file_names
+    
+    def test_cached_result_is_reused_until_file_changes(self, two_level_epub_path, tmp_path, monkeypatch):
+        """Test a cached result is returned for an unchanged file and dropped once it is modified."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        opened = []
+        real_open = EpubChapterDetector._open
+        
+        def counting_open(self, epub_path):
+            opened.append(epub_path)
+            return real_open(self, epub_path)
+        
+        monkeypatch.setattr(EpubChapterDetector, "_open", counting_open)
+        detector = EpubChapterDetector(strategy="native", use_cache=True)
+        
+        first = detector.detect(two_level_epub_path)
+        assert len(opened) == 1
+        assert list((tmp_path / "cache" / "epub-splitter").glob("*.json"))
+        assert not list((tmp_path / "cache" / "epub-splitter").glob("*.tmp"))
+        
+        assert detector.detect(two_level_epub_path) == first
+        assert len(opened) == 1
+        
+        stat = two_level_epub_path.stat()
+        os.utime(two_level_epub_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert detector.detect(two_level_epub_path) == first
+        assert len(opened) == 2
+    
+    def test_cache_key_includes_package_version(self, two_level_epub_path, monkeypatch):
+        """Test results cached by another release are not reused."""
+        detector = EpubChapterDetector(use_cache=True)
+        key = detector._cache_key(two_level_epub_path)
+        
+        monkeypatch.setattr("epub_splitter.detector.__version__", "0.0.0-other")
+        assert detector._cache_key(two_level_epub_path) != key
+    
+    def test_title_lookup_stops_at_first_heading(self, monkeypatch):
+        """Test a heading near the top of a large document is found without a full parse."""
+        detector = EpubChapterDetector(strategy="manifest")
+        
+        def no_full_parse(content):
+            raise AssertionError("full parse")
+        
+        monkeypatch.setattr(detector, "_parse_html", no_full_parse)
+        body = "<p>Text of the chapter.</p>" * 50_000
+        
+        content = f"<html><head><title>Book</title></head><body><h1>Café</h1>{body}</body></html>"
+        assert detector._extract_title_from_content(content.encode("utf-8")) == "Café"
+        
+        content = f"<html><body><h2>Part</h2><p>Intro</p><h1>Chapter</h1>{body}</body></html>"
+        assert detector._extract_title_from_content(content.encode("utf-8")) == "Chapter"
+        
+        content = f"<html><body><h2>Section</h2>{body}</body></html>"
+        assert detector._extract_title_from_content(content.encode("utf-8")) == "Section"
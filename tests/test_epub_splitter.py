@@ -0,0 +1,166 @@
+"""Unit tests for EPUB splitting."""
+
+import re
+import zipfile
+from dataclasses import replace
+import pytest
+from ebooklib import epub
+from lxml import etree
+from epub_splitter.detector import EpubChapterDetector
+from epub_splitter.splitter import EpubSplitter, _decode_html
+
+
+@pytest.fixture
+def sample_epub_path(tmp_path):
+    """Fixture providing an EPUB with 20 chapters, a stylesheet and a TOC."""
+    book = epub.EpubBook()
+    book.set_identifier("sample-book")
+    book.set_title("Sample Book")
+    book.set_language("en")
+    book.add_author("Jane Writer")
+    
+    style = epub.EpubItem(
+        uid="style", file_name="style/main.css", media_type="text/css", content=b"p { margin: 0 }"
+    )
+    book.add_item(style)
+    
+    documents = []
+    for number in range(1, 21):
+        document = epub.EpubHtml(
+            title=f"Chapter {number}", file_name=f"text/chapter_{number:02d}.xhtml", lang="en"
+        )
+        document.content = f"<h1>Chapter {number}</h1><p>Text of chapter {number}.</p>"
+        document.add_item(style)
+        book.add_item(document)
+        documents.append(document)
+    
+    book.toc = documents
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    book.spine = ["nav"] + documents
+    
+    epub_path = tmp_path / "sample.epub"
+    epub.write_epub(str(epub_path), book)
+    return epub_path
+
+
+@pytest.fixture
+def illustrated_epub_path(tmp_path):
+    """Fixture providing an EPUB with a cover image shown in every chapter and extra metadata."""
+    book = epub.EpubBook()
+    book.set_identifier("illustrated-book")
+    book.set_title("Illustrated Book")
+    book.set_language("en")
+    book.add_author("Jane Writer")
+    book.add_metadata("DC", "publisher", "Example Press")
+    book.set_cover("images/cover.jpg", b"\xff\xd8\xff\xe0 not really a jpeg")
+    
+    documents = []
+    for number in range(1, 4):
+        document = epub.EpubHtml(
+            title=f"Chapter {number}", file_name=f"text/chapter_{number}.xhtml", lang="en"
+        )
+        document.content = (
+            f'<h1>Chapter {number}</h1><img src="../images/cover.jpg" alt="Cover"/>'
+            f"<p>Text of chapter {number}.</p>"
+        )
+        book.add_item(document)
+        documents.append(document)
+    
+    book.toc = documents
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    book.spine = ["nav"] + documents
+    
+    epub_path = tmp_path / "illustrated.epub"
+    epub.write_epub(str(epub_path), book)
+    return epub_path
+
+
+class _ReadEpubSource:
+    """Source book loaded with epub.read_epub, as the splitter did before _LazyEpub."""
+    
+    def __init__(self, epub_path):
+        self._book = epub.read_epub(str(epub_path))
+        self.metadata = self._book.metadata
+    
+    def get_items(self):
+        return self._book.get_items()
+    
+    def close(self):
+        pass
+
+
+class TestEpubSplitter:
+    """Test cases for EpubSplitter class."""
+    
+    def test_chapter_epub_reads_back_with_ebooklib(self, sample_epub_path, tmp_path):
+        """Test chapter EPUBs written onto the shared template open with epub.read_epub."""
+        chapters = EpubChapterDetector().detect(sample_epub_path).chapters
+        created_files = EpubSplitter(tmp_path / "out").split(sample_epub_path, chapters[:2])
+        
+        chapter_book = epub.read_epub(str(created_files[1]))
+        assert [title for title, _ in chapter_book.get_metadata("DC", "title")] == [
+            "Sample Book",
+            "Chapter 2",
+        ]
+        assert chapter_book.get_metadata("DC", "creator")[0][0] == "Jane Writer"
+        assert {item.get_name() for item in chapter_book.get_items()} >= {
+            "text/chapter_02.xhtml",
+            "nav.xhtml",
+            "toc.ncx",
+        }
+        document = chapter_book.get_item_with_href("text/chapter_02.xhtml")
+        assert b"<h1>Chapter 2</h1>" in document.get_content()
+        assert [item_id for item_id, _ in chapter_book.spine] == ["nav", document.get_id()]
+    
+    def test_lazy_source_matches_read_epub(self, illustrated_epub_path, tmp_path, monkeypatch):
+        """Test reading only the needed archive entries writes the same chapters as read_epub."""
+        chapters = EpubChapterDetector().detect(illustrated_epub_path).chapters
+        lazy_files = EpubSplitter(tmp_path / "lazy").split(illustrated_epub_path, chapters)
+        
+        monkeypatch.setattr("epub_splitter.splitter._LazyEpub", _ReadEpubSource)
+        full_files = EpubSplitter(tmp_path / "full").split(illustrated_epub_path, chapters)
+        
+        def entries(path):
+            # Each chapter book gets a fresh UUID and modification time
+            with zipfile.ZipFile(path) as archive:
+                return {
+                    name: re.sub(
+                        rb"[0-9a-f]{8}(-[0-9a-f]{4}){3}-[0-9a-f]{12}|\d{4}-\d\d-\d\dT[\d:]{8}Z",
+                        b"",
+                        archive.read(name),
+                    )
+                    for name in archive.namelist()
+                }
+        
+        assert [path.name for path in lazy_files] == [path.name for path in full_files]
+        for lazy_file, full_file in zip(lazy_files, full_files):
+            assert entries(lazy_file) == entries(full_file)
+        
+        chapter_book = epub.read_epub(str(lazy_files[0]))
+        cover = chapter_book.get_item_with_href("images/cover.jpg")
+        assert cover.get_content() == b"\xff\xd8\xff\xe0 not really a jpeg"
+        assert chapter_book.get_metadata("DC", "publisher") == [("Example Press", {})]
+        # ebooklib releases key OPF meta entries differently, so check the package document
+        with zipfile.ZipFile(lazy_files[0]) as archive:
+            package = etree.fromstring(archive.read("EPUB/content.opf"))
+        meta = [dict(element.attrib) for element in package.iter(f"{{{epub.NAMESPACES['OPF']}}}meta")]
+        assert {"name": "cover", "content": "cover-img"} in meta
+    
+    def test_control_characters_in_titles_become_underscores(self, sample_epub_path, tmp_path):
+        """Test a TOC title with control characters still gives a clean file name."""
+        assert EpubSplitter._sanitize_filename("Part\x07One\x1b: The\tEnd") == "Part_One_The_End"
+        
+        chapter = EpubChapterDetector().detect(sample_epub_path).chapters[0]
+        chapter = replace(chapter, title="Chapter\t1\nOpening")
+        created_files = EpubSplitter(tmp_path / "out").split(sample_epub_path, [chapter])
+        assert [path.name for path in created_files] == ["01_Chapter_1_Opening.epub"]
+    
+    def test_decode_html_keeps_non_utf8_characters(self):
+        """Test documents that are not UTF-8 fall back without dropping characters."""
+        assert _decode_html("<p>café</p>".encode("utf-8")) == "<p>café</p>"
+        assert _decode_html("<p>café</p>".encode("latin-1")) == "<p>café</p>"
+        
+        declared = '<?xml version="1.0" encoding="windows-1252"?><p>\u201cquoted\u201d</p>'
+        assert _decode_html(declared.encode("windows-1252")) == declared
@@ -0,0 +1,52 @@
+"""Unit tests for PDF splitting."""
+
+import pytest
+import fitz
+from pdf_splitter.models import Chapter
+from pdf_splitter.splitter import PDFSplitter
+
+
+@pytest.fixture
+def chapter_pdf_path(tmp_path):
+    """Fixture providing a 40-page PDF with a numbered heading on every other page."""
+    pdf_path = tmp_path / "book.pdf"
+    doc = fitz.open()
+    for page_index in range(40):
+        page = doc.new_page()
+        if page_index % 2 == 0:
+            page.insert_text((72, 72), f"Chapter {page_index // 2 + 1}", fontsize=24)
+        page.insert_text((72, 120), "Body text on the page.", fontsize=12)
+    doc.set_metadata({"title": "Sample Book", "author": "Jane Writer"})
+    doc.save(pdf_path)
+    doc.close()
+    return pdf_path
+
+
+@pytest.fixture
+def chapters():
+    """Fixture providing the 20 two-page chapters of chapter_pdf_path."""
+    return [
+        Chapter(title=f"Chapter {number}", start_page=2 * number - 1, end_page=2 * number)
+        for number in range(1, 21)
+    ]
+
+
+class TestPDFSplitter:
+    """Test cases for PDFSplitter class."""
+    
+    def test_write_bookmarked(self, chapter_pdf_path, chapters, tmp_path):
+        """Test selected chapters are written to one PDF with a bookmark each."""
+        selected = [chapters[1], chapters[4], chapters[5]]
+        
+        output_path = PDFSplitter(tmp_path / "out").write_bookmarked(chapter_pdf_path, selected)
+        
+        assert output_path == tmp_path / "out" / "book_bookmarked.pdf"
+        with fitz.open(output_path) as doc:
+            assert doc.page_count == 6
+            assert doc.get_toc() == [
+                [1, "Chapter 2", 1],
+                [1, "Chapter 5", 3],
+                [1, "Chapter 6", 5],
+            ]
+            assert doc[2].get_text().startswith("Chapter 5")
+            assert doc.metadata["title"] == "Sample Book"
@@ -0,0 +1,110 @@
+"""Tests for running detection and splitting in worker processes."""
+
+import importlib
+import zipfile
+import pytest
+import fitz
+from ebooklib import epub
+from epub_splitter.detector import EpubChapterDetector
+from epub_splitter.splitter import EpubSplitter
+from pdf_splitter.detector import ChapterDetector
+from pdf_splitter.splitter import PDFSplitter
+
+
+@pytest.fixture
+def books(tmp_path):
+    """Fixture providing an 80-page PDF and a 40-document EPUB, each with 40 chapters."""
+    pdf_path = tmp_path / "book.pdf"
+    doc = fitz.open()
+    for page_index in range(80):
+        page = doc.new_page()
+        if page_index % 2 == 0:
+            page.insert_text((72, 72), f"Chapter {page_index // 2 + 1}", fontsize=24)
+        page.insert_text((72, 120), f"Body text on page {page_index + 1}.", fontsize=12)
+    doc.save(pdf_path)
+    doc.close()
+    
+    book = epub.EpubBook()
+    book.set_identifier("large-book")
+    book.set_title("Large Book")
+    book.set_language("en")
+    documents = []
+    for number in range(1, 41):
+        document = epub.EpubHtml(
+            title=f"Chapter {number}", file_name=f"chapter_{number:02d}.xhtml", lang="en"
+        )
+        document.content = f"<h1>Chapter {number}</h1><p>Text of chapter {number}.</p>"
+        book.add_item(document)
+        documents.append(document)
+    book.toc = documents
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    book.spine = ["nav"] + documents
+    epub_path = tmp_path / "book.epub"
+    epub.write_epub(str(epub_path), book)
+    
+    return pdf_path, epub_path
+
+
+def detect_pdf(pdf_path, epub_path, output_dir, max_workers):
+    """Detect chapters in the PDF by heuristics."""
+    return ChapterDetector(max_workers=max_workers).detect(pdf_path, strategy="heuristic").chapters
+
+
+def split_pdf(pdf_path, epub_path, output_dir, max_workers):
+    """Split the PDF and return each file's name and page texts."""
+    chapters = ChapterDetector().detect(pdf_path, strategy="heuristic").chapters
+    created_files = PDFSplitter(output_dir, max_workers=max_workers).split(pdf_path, chapters)
+    return [
+        (path.name, [page.get_text() for page in fitz.open(path)]) for path in created_files
+    ]
+
+
+def detect_epub(pdf_path, epub_path, output_dir, max_workers):
+    """Detect chapters in the EPUB from its headings."""
+    detector = EpubChapterDetector(strategy="structural", max_workers=max_workers)
+    return detector.detect(epub_path).chapters
+
+
+def split_epub(pdf_path, epub_path, output_dir, max_workers):
+    """Split the EPUB and return each file's name and chapter documents."""
+    chapters = EpubChapterDetector().detect(epub_path).chapters
+    created_files = EpubSplitter(output_dir, max_workers=max_workers).split(epub_path, chapters)
+    contents = []
+    for path in created_files:
+        # Compare the chapter documents; each package gets a fresh UUID and timestamp
+        with zipfile.ZipFile(path) as archive:
+            contents.append(
+                (path.name, [archive.read(name) for name in archive.namelist() if "chapter_" in name])
+            )
+    return contents
+
+
+@pytest.mark.parametrize(
+    "module, run",
+    [
+        ("pdf_splitter.detector", detect_pdf),
+        ("pdf_splitter.splitter", split_pdf),
+        ("epub_splitter.detector", detect_epub),
+        ("epub_splitter.splitter", split_epub),
+    ],
+)
+def test_worker_processes_match_serial_run(books, tmp_path, monkeypatch, module, run):
+    """Test running with worker processes gives the same result as a single process."""
+    pdf_path, epub_path = books
+    pools = []
+    real_pool = importlib.import_module(module).ProcessPoolExecutor
+    
+    def counting_pool(*args, **kwargs):
+        pools.append(kwargs.get("max_workers"))
+        return real_pool(*args, **kwargs)
+    
+    monkeypatch.setattr(f"{module}.ProcessPoolExecutor", counting_pool)
+    
+    serial = run(pdf_path, epub_path, tmp_path / "serial", 1)
+    assert pools == []
+    
+    parallel = run(pdf_path, epub_path, tmp_path / "parallel", 2)
+    assert pools == [2]
+    assert parallel == serial
+    assert len(serial) >= 40